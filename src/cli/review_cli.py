@@ -1,30 +1,48 @@
 import argparse
 import csv
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+try:
+    from src.utils.json_io import dump_json, json_entries, load_json
+except ModuleNotFoundError:
+    # Support running with `src` itself on sys.path (tests, `python src/main.py`).
+    from utils.json_io import dump_json, json_entries, load_json
 
 
 def compute_confidence(item: Dict[str, Any]) -> (float, List[str]):
+    score, issues, _ = _score_sections(
+        item.get("metadata", {}),
+        item.get("vagas", {}),
+        item.get("financeiro", {}),
+        item.get("cronograma", {}),
+    )
+    return score, issues
+
+
+def _score_sections(md: Dict[str, Any], vagas: Dict[str, Any], fin: Dict[str, Any], cron: Dict[str, Any]) -> (float, List[str], Any):
+    """compute_confidence on the already-fetched summary sections.
+
+    Also returns the banca name it resolved, for the review row.
+    """
     score = 0.0
     issues: List[str] = []
-    md = item.get("metadata", {})
-    vagas = item.get("vagas", {})
-    fin = item.get("financeiro", {})
-    cron = item.get("cronograma", {})
+    md_get = md.get
 
-    if md.get("orgao"):
+    if md_get("orgao"):
         score += 0.2
     else:
         issues.append("missing_orgao")
 
-    if md.get("edital_numero"):
+    if md_get("edital_numero"):
         score += 0.2
     else:
         issues.append("missing_edital_numero")
 
-    if md.get("cargo"):
+    if md_get("cargo"):
         score += 0.2
     else:
         issues.append("missing_cargo")
@@ -46,14 +64,15 @@ def compute_confidence(item: Dict[str, Any]) -> (float, List[str]):
         issues.append("missing_key_dates")
 
     # content sanity checks
-    banca = md.get("banca")
+    banca = md_get("banca")
     banca_nome = None
     if isinstance(banca, dict):
         banca_nome = banca.get("nome")
+        banca_conf = banca.get("confianca_extracao")
         # if banca dict has low confidence, flag
-        if banca.get("confianca_extracao") is not None and banca.get("confianca_extracao") < 0.6:
+        if banca_conf is not None and banca_conf < 0.6:
             issues.append("banca_low_confidence")
-        if banca.get("nome") and ("\n" in banca.get("nome") or len(banca.get("nome")) > 120):
+        if banca_nome and ("\n" in banca_nome or len(banca_nome) > 120):
             issues.append("banca_messy")
     else:
         banca_nome = banca
@@ -70,7 +89,7 @@ def compute_confidence(item: Dict[str, Any]) -> (float, List[str]):
     if score > 1.0:
         score = 1.0
 
-    return round(score, 2), issues
+    return round(score, 2), issues, banca_nome
 
 
 def _format_date_range(start: str, end: str) -> str:
@@ -108,76 +127,161 @@ def _summarize_cronograma(cron: Dict) -> str:
     return " | ".join(parts) if parts else ""
 
 
-def generate_csv(out_path: Path, summaries_dir: Path):
-    summaries = sorted(summaries_dir.glob("*.json"))
+FIELDNAMES = (
+    "file",
+    "orgao",
+    "edital_numero",
+    "cargo",
+    "banca",
+    "vagas_total",
+    "vagas_pcd",
+    "vagas_ppiq",
+    "taxa_inscricao",
+    "cronograma",
+    "confidence",
+    "issues",
+)
+
+# Output buffer for the review CSV; rows are flushed once when the file closes.
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# Below this many summaries the pool startup costs more than it saves.
+PARALLEL_MIN_SUMMARIES = 64
+
+
+def _process_summary(path: str) -> Optional[tuple]:
+    """Build the review row for one summary file, or None if it cannot be parsed."""
+    try:
+        data = load_json(path)
+    except Exception:
+        return None
+
+    md = data.get("metadata", {})
+    vagas = data.get("vagas", {})
+    fin = data.get("financeiro", {})
+    cron = data.get("cronograma", {})
+    conf, issues, banca_nome = _score_sections(md, vagas, fin, cron)
+
+    # Positional, in FIELDNAMES order
+    return (
+        os.path.basename(path),
+        md.get("orgao", ""),
+        md.get("edital_numero", ""),
+        md.get("cargo", ""),
+        banca_nome or "",
+        vagas.get("total", ""),
+        vagas.get("pcd", ""),
+        vagas.get("ppiq", ""),
+        fin.get("taxa_inscricao", ""),
+        _summarize_cronograma(cron),
+        conf,
+        ";".join(issues),
+    )
+
+
+# Rows from the previous run, keyed by summary file name and its stat.
+# Kept under .cache so the summaries "*.json" glob does not pick it up, and in
+# its own subdirectory so the extraction cache's pruning never counts it.
+REVIEW_CACHE_NAME = Path(".cache") / "review" / "review_rows.json"
+# Bump when _process_summary / compute_confidence change so rows are rebuilt.
+REVIEW_CACHE_VERSION = 1
+
+
+def _read_review_cache(cache_path: Path) -> Dict[str, Any]:
+    try:
+        cache = load_json(cache_path)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != REVIEW_CACHE_VERSION:
+        return {}
+    return cache.get("rows") or {}
+
+
+def _write_review_cache(cache_path: Path, rows: Dict[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        dump_json({"version": REVIEW_CACHE_VERSION, "rows": rows}, tmp_path, indent=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _review_rows(summaries_dir: Path, use_cache: bool = True) -> List[tuple]:
+    """Review rows (FIELDNAMES order) for every summary in summaries_dir.
+
+    Rows are cached by (mtime_ns, size) of each summary, so a re-run only
+    re-reads the files that changed (use_cache=False rebuilds them all).
+    """
+    summaries = json_entries(summaries_dir)
+    cache_path = summaries_dir / REVIEW_CACHE_NAME
+    cached = _read_review_cache(cache_path) if use_cache else {}
+
+    results: Dict[str, Any] = {}
+    stats = {}
+    stale = []
+    for entry in summaries:
+        name = entry.name
+        try:
+            st = entry.stat()
+        except OSError:
+            stale.append(entry.path)
+            continue
+        stats[name] = [st.st_mtime_ns, st.st_size]
+        hit = cached.get(name)
+        if hit is not None and hit[:2] == stats[name]:
+            results[name] = hit[2]
+        else:
+            stale.append(entry.path)
+
+    if len(stale) < PARALLEL_MIN_SUMMARIES:
+        fresh = map(_process_summary, stale)
+    else:
+        # map() keeps the input order, so the CSV is the same as serial
+        with ProcessPoolExecutor() as executor:
+            fresh = list(executor.map(_process_summary, stale, chunksize=32))
+    results.update(zip(map(os.path.basename, stale), fresh))
     rows = []
-    for p in summaries:
-        with p.open(encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-            except Exception:
-                continue
-
-        conf, issues = compute_confidence(data)
-        md = data.get("metadata", {})
-        vagas = data.get("vagas", {})
-        fin = data.get("financeiro", {})
-        cron = data.get("cronograma", {})
-
-        # Extract banca_nome from metadata
-        banca = md.get("banca")
-        banca_nome = None
-        if isinstance(banca, dict):
-            banca_nome = banca.get("nome")
+    bad = []
+    for e in summaries:
+        row = results[e.name]
+        if row is None:
+            bad.append(e.name)
         else:
-            banca_nome = banca
-
-        rows.append({
-            "file": p.name,
-            "orgao": md.get("orgao", ""),
-            "edital_numero": md.get("edital_numero", ""),
-            "cargo": md.get("cargo", ""),
-            "banca": banca_nome or "",
-            "vagas_total": vagas.get("total", ""),
-            "vagas_pcd": vagas.get("pcd", ""),
-            "vagas_ppiq": vagas.get("ppiq", ""),
-            "taxa_inscricao": fin.get("taxa_inscricao", ""),
-            "cronograma": _summarize_cronograma(cron),
-            "confidence": conf,
-            "issues": ";".join(issues),
+            rows.append(row)
+    if bad:
+        more = ", ..." if len(bad) > 5 else ""
+        print(f"Skipped {len(bad)} malformed summaries: {', '.join(bad[:5])}{more}")
+
+    if use_cache:
+        _write_review_cache(cache_path, {
+            e.name: stats[e.name] + [results[e.name]] for e in summaries if e.name in stats
         })
 
-    # write CSV
+    return rows
+
+
+def _write_review_csv(out_path: Path, rows: List[tuple]) -> Path:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "file",
-        "orgao",
-        "edital_numero",
-        "cargo",
-        "banca",
-        "vagas_total",
-        "vagas_pcd",
-        "vagas_ppiq",
-        "taxa_inscricao",
-        "cronograma",
-        "confidence",
-        "issues",
-    ]
-
-    with out_path.open("w", encoding="utf-8", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+    with out_path.open("w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(rows)
 
     return out_path
 
 
+def generate_csv(out_path: Path, summaries_dir: Path, use_cache: bool = True):
+    """Write the review CSV for every summary in summaries_dir."""
+    return _write_review_csv(out_path, _review_rows(summaries_dir, use_cache))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate CSV to review extractions")
     parser.add_argument("--summaries-dir", default="data/summaries")
     parser.add_argument("--out", default=None, help="Output CSV path")
     parser.add_argument("--threshold", type=float, default=0.6, help="Confidence threshold for low-confidence flag")
+    parser.add_argument("--no-cache", action="store_true", help="Rebuild every row instead of reusing unchanged ones")
 
     args = parser.parse_args()
     summaries_dir = Path(args.summaries_dir)
@@ -187,20 +291,15 @@ def main():
         ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
         out_path = Path("data") / f"review_{ts}.csv"
 
-    out = generate_csv(out_path, summaries_dir)
+    # Rows are kept so the low-confidence listing does not re-read the CSV
+    rows = _review_rows(summaries_dir, use_cache=not args.no_cache)
+    out = _write_review_csv(out_path, rows)
     print(f"CSV written to: {out}")
 
     # print low-confidence entries
-    import csv as _csv
-    low = []
-    with out.open(encoding="utf-8") as f:
-        rdr = _csv.DictReader(f)
-        for row in rdr:
-            try:
-                if float(row.get("confidence", 0)) < args.threshold:
-                    low.append((row["file"], row.get("confidence"), row.get("issues")))
-            except Exception:
-                continue
+    conf_i = FIELDNAMES.index("confidence")
+    issues_i = FIELDNAMES.index("issues")
+    low = [(row[0], row[conf_i], row[issues_i]) for row in rows if row[conf_i] < args.threshold]
 
     if low:
         print("\nLow-confidence extractions:")
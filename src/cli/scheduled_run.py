@@ -1,18 +1,19 @@
 import argparse
+import contextlib
+import io
 import json
 import os
 import re
 import shutil
-import smtplib
 import subprocess
 import sys
+import traceback
 from datetime import datetime
-from email.message import EmailMessage
 from pathlib import Path
-from urllib import error, request
 
 
-COUNT_PATTERN = re.compile(r"Total abertura concursos \(keywords: .*?\):\s*(\d+)")
+# Only needed for --subprocess runs; in-process runs get the count from main.run().
+COUNT_PATTERN = re.compile(r"Total de concursos de abertura \(palavras-chave: .*?\):\s*(\d+)")
 
 
 DEFAULT_DASHBOARD_CONFIG = {
@@ -42,10 +43,51 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Optional path to save full command output",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run src/main.py in a child interpreter instead of in-process (isolation)",
+    )
     return parser.parse_args()
 
 
-def run_monitor(project_root: Path, days: int) -> tuple[int, str]:
+def run_monitor(project_root: Path, days: int, use_subprocess: bool = False) -> dict:
+    """Run the monitor; returns {"returncode": int, "count": int | None, "output": str}."""
+    if use_subprocess:
+        return run_monitor_subprocess(project_root, days)
+    return run_monitor_in_process(project_root, days)
+
+
+def run_monitor_in_process(project_root: Path, days: int) -> dict:
+    """Call main.run() in this interpreter, capturing its output."""
+    src_dir = str(project_root / "src")
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+
+    buf = io.StringIO()
+    count = None
+    previous_cwd = os.getcwd()
+    # main.py resolves data/ and editais/ relative to the working directory.
+    os.chdir(project_root)
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            try:
+                from main import run
+
+                result = run(days)
+                return_code = result["returncode"]
+                count = result["count"]
+            except SystemExit as exc:
+                return_code = exc.code if isinstance(exc.code, int) else 1
+            except Exception:
+                traceback.print_exc()
+                return_code = 1
+    finally:
+        os.chdir(previous_cwd)
+    return {"returncode": return_code, "count": count, "output": buf.getvalue()}
+
+
+def run_monitor_subprocess(project_root: Path, days: int) -> dict:
     main_py = project_root / "src" / "main.py"
     cmd = [sys.executable, str(main_py), "-d", str(days)]
     process = subprocess.run(
@@ -55,8 +97,12 @@ def run_monitor(project_root: Path, days: int) -> tuple[int, str]:
         text=True,
         check=False,
     )
-    output = (process.stdout or "") + ("\n" + process.stderr if process.stderr else "")
-    return process.returncode, output
+    parts = [process.stdout or ""]
+    if process.stderr:
+        parts.append("\n")
+        parts.append(process.stderr)
+    output = "".join(parts)
+    return {"returncode": process.returncode, "count": extract_count(output), "output": output}
 
 
 def extract_count(output: str) -> int | None:
@@ -96,6 +142,10 @@ def send_email(subject: str, body: str, fallback_email_to: str = "") -> bool:
     if not all([host, user, password, to_addr, from_addr]):
         return False
 
+    # Imported here: most runs have no SMTP configured.
+    import smtplib
+    from email.message import EmailMessage
+
     msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = from_addr
@@ -118,6 +168,8 @@ def send_webhook(subject: str, body: str, fallback_webhook_url: str = "") -> boo
     if not webhook_url:
         return False
 
+    from urllib import error, request
+
     payload = f"{subject}\n\n{body}".encode("utf-8")
     req = request.Request(
         webhook_url,
@@ -162,10 +214,11 @@ def main() -> int:
     dashboard_notifications = load_dashboard_notification_settings(project_root)
     threshold = args.threshold if args.threshold is not None else int(dashboard_notifications["threshold"])
 
-    return_code, output = run_monitor(project_root=project_root, days=args.days)
+    result = run_monitor(project_root=project_root, days=args.days, use_subprocess=args.subprocess)
+    return_code, output, count = result["returncode"], result["output"], result["count"]
     maybe_save_output(args.save_output, output)
+    tail = output[-5000:]
 
-    count = extract_count(output)
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def notify_any(subject: str, body: str) -> bool:
@@ -177,7 +230,7 @@ def main() -> int:
 
     if return_code != 0:
         subject = "[Doumon] Execution failed"
-        body = f"Run at: {now}\nExit code: {return_code}\n\nOutput:\n{output[-5000:]}"
+        body = f"Run at: {now}\nExit code: {return_code}\n\nOutput:\n{tail}"
         notified = notify_any(subject, body)
         print(output)
         print("Failure notification sent." if notified else "Execution failed and no notifier was configured.")
@@ -187,7 +240,7 @@ def main() -> int:
 
     if count is None:
         subject = "[Doumon] Could not parse abertura count"
-        body = f"Run at: {now}\n\nOutput snippet:\n{output[-5000:]}"
+        body = f"Run at: {now}\n\nOutput snippet:\n{tail}"
         notified = notify_any(subject, body)
         print("Parse warning notification sent." if notified else "Could not parse count and no notifier was configured.")
         return 0
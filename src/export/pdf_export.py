@@ -1,5 +1,6 @@
 import os
 from contextlib import contextmanager
+from pathlib import Path
 
 from playwright.sync_api import sync_playwright
 
@@ -9,6 +10,25 @@ USER_AGENT = (
     "Chrome/121.0.0.0 Safari/537.36"
 )
 
+# Requests that never end up in the printed edital. Blocking them lets the
+# "load" event fire as soon as the article itself is ready.
+BLOCKED_RESOURCE_TYPES = ("media",)
+BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+)
+
+
+def _block_unneeded(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(d in request.url for d in BLOCKED_DOMAINS):
+        route.abort()
+    else:
+        route.continue_()
+
 
 @contextmanager
 def _playwright_context():
@@ -27,6 +47,7 @@ def _playwright_context():
             locale="pt-BR",
             timezone_id="America/Sao_Paulo",
         )
+        context.route("**/*", _block_unneeded)
         yield context
     finally:
         # Clean up in reverse order
@@ -47,6 +68,82 @@ def _playwright_context():
                 pass
 
 
+def _output_filename(concurso, output_dir, output_path):
+    if output_path:
+        filename = output_path
+        parent = os.path.dirname(filename)
+        if parent:
+            Path(parent).mkdir(parents=True, exist_ok=True)
+    else:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        filename = os.path.join(output_dir, f"{concurso['url_title']}.pdf")
+    return filename
+
+
+def _remove_existing(filename):
+    """Remove a previous PDF (it may be locked by a viewer). Returns an error message or None."""
+    try:
+        Path(filename).unlink()
+    except FileNotFoundError:
+        pass
+    except PermissionError:
+        return f"Error: File is locked or in use: {filename}\nClose any PDF viewer that has this file open and try again."
+    except Exception as e:
+        return f"Error removing old file: {e}"
+    return None
+
+
+def _render_pdf(page, concurso, filename):
+    """Navigate an open page to the concurso URL and print it to `filename`."""
+    response = page.goto(concurso['url'], wait_until="load", timeout=30000)
+    if response is not None and response.status >= 400:
+        return f"Error saving PDF: DOU returned HTTP {response.status} for URL {concurso['url']}"
+
+    # Some DOU not-found pages can return 200; detect by page text before printing.
+    page_text = page.content().lower()
+    if (
+        "estado" in page_text
+        and "não encontrado" in page_text
+        and "o recurso requisitado não foi encontrado" in page_text
+    ):
+        return f"Error saving PDF: DOU page indicates resource not found for URL {concurso['url']}"
+
+    page.emulate_media(media="print")
+    page.pdf(
+        path=filename,
+        format="A4",
+        print_background=True,
+        prefer_css_page_size=True,
+    )
+    return f"Content saved to {filename}"
+
+
+def _save_with_page(page, concurso, output_dir="editais", output_path=None):
+    """Render one concurso on a shared page.
+
+    Returns (message, page_usable); page_usable is False after an unexpected
+    exception, since the page may have crashed or been closed.
+    """
+    filename = _output_filename(concurso, output_dir, output_path)
+    error = _remove_existing(filename)
+    if error:
+        return error, True
+
+    try:
+        return _render_pdf(page, concurso, filename), True
+    except PermissionError:
+        return f"Error: Permission denied writing to {filename}\nEnsure the file is not open in another application.", True
+    except Exception as e:
+        return f"Error saving PDF: {e}", False
+
+
+def _close_page(page):
+    try:
+        page.close()
+    except Exception:
+        pass
+
+
 def save_concurso_pdf(concurso, output_dir="editais", output_path=None):
     """
     Download PDF from DOU using Playwright.
@@ -59,49 +156,17 @@ def save_concurso_pdf(concurso, output_dir="editais", output_path=None):
     Returns:
         Success message string or error message string starting with "Error"
     """
-    if output_path:
-        filename = output_path
-        parent = os.path.dirname(filename)
-        if parent:
-            os.makedirs(parent, exist_ok=True)
-    else:
-        os.makedirs(output_dir, exist_ok=True)
-        filename = os.path.join(output_dir, f"{concurso['url_title']}.pdf")
-
-    # If file exists and is locked, try to remove it first
-    if os.path.exists(filename):
-        try:
-            os.remove(filename)
-        except PermissionError:
-            return f"Error: File is locked or in use: {filename}\nClose any PDF viewer that has this file open and try again."
-        except Exception as e:
-            return f"Error removing old file: {e}"
+    filename = _output_filename(concurso, output_dir, output_path)
+    error = _remove_existing(filename)
+    if error:
+        return error
 
     # Use context manager to ensure cleanup
     try:
         with _playwright_context() as context:
             page = context.new_page()
             try:
-                response = page.goto(concurso['url'], wait_until="networkidle", timeout=30000)
-                if response is not None and response.status >= 400:
-                    return f"Error saving PDF: DOU returned HTTP {response.status} for URL {concurso['url']}"
-
-                # Some DOU not-found pages can return 200; detect by page text before printing.
-                page_text = page.content().lower()
-                if (
-                    "estado" in page_text
-                    and "não encontrado" in page_text
-                    and "o recurso requisitado não foi encontrado" in page_text
-                ):
-                    return f"Error saving PDF: DOU page indicates resource not found for URL {concurso['url']}"
-
-                page.emulate_media(media="print")
-                page.pdf(
-                    path=filename,
-                    format="A4",
-                    print_background=True,
-                    prefer_css_page_size=True,
-                )
+                return _render_pdf(page, concurso, filename)
             finally:
                 page.close()
     except PermissionError:
@@ -109,4 +174,34 @@ def save_concurso_pdf(concurso, output_dir="editais", output_path=None):
     except Exception as e:
         return f"Error saving PDF: {e}"
 
-    return f"Content saved to {filename}"
+
+def save_concurso_pdfs(concursos, output_dir="editais"):
+    """
+    Download several PDFs from DOU, reusing one browser context and one page.
+
+    Launching Chromium and creating a page dominate the cost of small editais,
+    so batch callers (the CLI) should prefer this over repeated
+    save_concurso_pdf calls.
+
+    Yields one result message per concurso, in order, with the same
+    success/"Error..." convention as save_concurso_pdf.
+    """
+    pending = iter(concursos)
+    try:
+        with _playwright_context() as context:
+            page = context.new_page()
+            try:
+                for concurso in pending:
+                    result, page_usable = _save_with_page(page, concurso, output_dir=output_dir)
+                    yield result
+                    if not page_usable:
+                        # A crashed/closed page would fail every remaining
+                        # concurso; start the next one on a fresh page.
+                        _close_page(page)
+                        page = context.new_page()
+            finally:
+                _close_page(page)
+    except Exception as e:
+        # Browser could not be started (or died): report it for every remaining concurso.
+        for _ in pending:
+            yield f"Error saving PDF: {e}"
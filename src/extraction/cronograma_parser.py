@@ -9,9 +9,14 @@ Strategy:
 5. Map to 4 essential fields
 """
 
+import os
 import re
-from typing import Dict, List, Optional
-from datetime import datetime
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+from datetime import date, datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,93 +24,139 @@ logger = logging.getLogger(__name__)
 
 # Comprehensive date pattern: handles single dates, ranges, and "Entre"
 # Case-insensitive to match both "a" and "A"
+# Ranges and single dates share the leading DD/MM/YYYY, so the range tail is
+# optional instead of a separate branch that re-scans the same digits.
+# Stays on stdlib re: RE2's \s/\d are ASCII-only, and PDF text is full of
+# NBSPs between dates; the section regex also needs a lookahead RE2 lacks.
 DATE_PATTERN = re.compile(
     r'('
-        r'\d{2}/\d{2}/\d{4}\s*a\s*\d{2}/\d{2}/\d{4}'
+        r'\d{2}/\d{2}/\d{4}(?:\s*a\s*\d{2}/\d{2}/\d{4})?'
         r'|Entre\s+\d{2}/\d{2}/\d{4}(?:\s*(?:e|a)\s*\d{2}/\d{2}/\d{4})?'
-        r'|\d{2}/\d{2}/\d{4}'
     r')',
     re.IGNORECASE
 )
 
 
+@lru_cache(maxsize=1024)
 def to_iso(date_str: str) -> Optional[str]:
     """Convert DD/MM/YYYY to ISO YYYY-MM-DD."""
+    s = date_str.strip()
+    # Fast path for the fixed DD/MM/YYYY shape DATE_PATTERN produces;
+    # date() still rejects impossible days like 31/02.
+    digits = s[:2] + s[3:5] + s[6:]
+    if len(s) == 10 and s[2] == "/" and s[5] == "/" and digits.isascii() and digits.isdigit():
+        try:
+            return date(int(s[6:]), int(s[3:5]), int(s[:2])).isoformat()
+        except ValueError:
+            return None
     try:
-        dt = datetime.strptime(date_str.strip(), "%d/%m/%Y")
+        dt = datetime.strptime(s, "%d/%m/%Y")
         return dt.date().isoformat()
     except Exception:
         return None
 
 
+# normalize_text patterns, compiled once at import time.
+_DATE = r'\d{2}/\d{2}/\d{4}'
+_DATE_OR_RANGE = rf'{_DATE}(?:\s+a\s+{_DATE})?'
+
+# STEP 1: label appears BETWEEN the dates of a range
+_TABLE_FMT_RE = re.compile(rf'({_DATE})\s+a\s+[^\n]*\n\s*([^\n]+)\n\s*({_DATE})')
+
+# STEP 1.5: label on one line, date on the next. Kept as separate passes: a
+# later label pass may join a line that an earlier pass already joined.
+_LABEL_BREAK_RES = tuple(
+    re.compile(rf'({label}[^\n]{{0,100}})\n\s*({_DATE_OR_RANGE})', re.IGNORECASE)
+    for label in (
+        r'inscri[çc][ãõ]',
+        r'isen[çc][ãa]o',
+        r'(?:aplica[çc][ãa]o\s+da\s+)?provas?',
+    )
+)
+
+# STEP 2: URLs
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+
+# STEPS 3+4: broken "DD/MM/YYYY a\nDD/MM/YYYY" ranges and broken "Entre\nDD/MM/YYYY".
+# The optional tail of the "entre" branch covers an Entre date that is itself
+# the start of a broken range, which the sequential passes also rejoined.
+_BROKEN_DATE_RE = re.compile(
+    rf'(?P<r1>{_DATE})\s*a\s*\n\s*(?P<r2>{_DATE})'
+    rf'|(?i:entre)\s*\n\s*(?P<e1>{_DATE})(?:\s*a\s*\n\s*(?P<e2>{_DATE}))?'
+)
+
+# STEP 5: "Entre DD/MM/YYYY a [text] DD/MM/YYYY"
+_ENTRE_RANGE_RE = re.compile(
+    rf'(Entre\s+{_DATE})\s+a\s*\n?\s*([^\d\n]+)?\s*({_DATE})',
+    re.IGNORECASE
+)
+
+# STEP 6: runs of spaces/tabs (a lone space is already normalized) and 3+ newlines
+_WHITESPACE_RE = re.compile(r'(\n{3,})|[ \t]{2,}|\t')
+
+# Single DD/MM/YYYY inside a date block
+_DATE_RE = re.compile(_DATE)
+
+# Portal note removed from date contexts, up to the end of its line
+_NOTA = "Nota Informativa"
+_NOTA_RE = re.compile(r'Nota Informativa.*')
+# Trailing connectors stripped from event labels
+_TRAIL_CHARS = ":-–"
+
+
+def _fix_broken_date(match: re.Match) -> str:
+    if match.group("r1"):
+        return f"{match.group('r1')} a {match.group('r2')}"
+    if match.group("e2"):
+        return f"Entre {match.group('e1')} a {match.group('e2')}"
+    return f"Entre {match.group('e1')}"
+
+
+def _collapse_whitespace(match: re.Match) -> str:
+    return "\n\n" if match.group(1) else " "
+
+
+@lru_cache(maxsize=64)
 def normalize_text(text: str) -> str:
     """
     Normalize PDF text to handle broken line breaks and noise.
     Handles multiple table formats commonly found in editais.
     """
-    # STEP 1: Handle table format where label appears BETWEEN dates
-    # "DD/MM/YYYY a URL\nLABEL\nDD/MM/YYYY" -> "LABEL DD/MM/YYYY a DD/MM/YYYY"
-    text = re.sub(
-        r'(\d{2}/\d{2}/\d{4})\s+a\s+[^\n]*\n\s*([^\n]+)\n\s*(\d{2}/\d{2}/\d{4})',
-        r'\2 \1 a \3',
-        text
-    )
-    
-    # STEP 1.5: Handle common table formats with activity on one line and date on next
-    # "Activity name\nDD/MM/YYYY" or "Activity name\nDD/MM/YYYY a DD/MM/YYYY"
-    # Handles both singular (inscrição) and plural (inscrições)
-    text = re.sub(
-        r'(inscri[çc][ãõ][^\n]{0,100})\n\s*(\d{2}/\d{2}/\d{4}(?:\s+a\s+\d{2}/\d{2}/\d{4})?)',
-        r'\1 \2',
-        text,
-        flags=re.IGNORECASE
-    )
-    text = re.sub(
-        r'(isen[çc][ãa]o[^\n]{0,100})\n\s*(\d{2}/\d{2}/\d{4}(?:\s+a\s+\d{2}/\d{2}/\d{4})?)',
-        r'\1 \2',
-        text,
-        flags=re.IGNORECASE
-    )
-    text = re.sub(
-        r'((?:aplica[çc][ãa]o\s+da\s+)?provas?[^\n]{0,100})\n\s*(\d{2}/\d{2}/\d{4}(?:\s+a\s+\d{2}/\d{2}/\d{4})?)',
-        r'\1 \2',
-        text,
-        flags=re.IGNORECASE
-    )
-    
+    # Steps 1-5 all rewrite around a DD/MM/YYYY date; without a "/" none can match.
+    # Steps 1, 1.5 and 3+4 also only rejoin text split across lines.
+    has_date = "/" in text
+    has_break = has_date and "\n" in text
+
+    if has_break:
+        # STEP 1: Handle table format where label appears BETWEEN dates
+        # "DD/MM/YYYY a URL\nLABEL\nDD/MM/YYYY" -> "LABEL DD/MM/YYYY a DD/MM/YYYY"
+        text = _TABLE_FMT_RE.sub(r'\2 \1 a \3', text)
+
+        # STEP 1.5: Handle common table formats with activity on one line and date on next
+        # "Activity name\nDD/MM/YYYY" or "Activity name\nDD/MM/YYYY a DD/MM/YYYY"
+        # Handles both singular (inscrição) and plural (inscrições)
+        for pattern in _LABEL_BREAK_RES:
+            text = pattern.sub(r'\1 \2', text)
+
     # STEP 2: Remove URLs (after restructuring table)
-    text = re.sub(r'https?://\S+|www\.\S+', '', text)
-    
-    # STEP 3: Fix broken date ranges split by newline
-    text = re.sub(
-        r'(\d{2}/\d{2}/\d{4})\s*a\s*\n\s*(\d{2}/\d{2}/\d{4})',
-        r'\1 a \2',
-        text
-    )
-    
-    # STEP 4: Fix broken "Entre" (handles both "Entre" and "entre")
-    text = re.sub(
-        r'Entre\s*\n\s*(\d{2}/\d{2}/\d{4})',
-        r'Entre \1',
-        text,
-        flags=re.IGNORECASE
-    )
-    
-    # STEP 5: Fix "Entre DD/MM/YYYY a [text] DD/MM/YYYY"
-    text = re.sub(
-        r'(Entre\s+\d{2}/\d{2}/\d{4})\s+a\s*\n?\s*([^\d\n]+)?\s*(\d{2}/\d{2}/\d{4})',
-        r'\1 a \3',
-        text,
-        flags=re.IGNORECASE
-    )
-    
+    if "http" in text or "www." in text:
+        text = _URL_RE.sub('', text)
+
+    if has_break:
+        # STEPS 3+4: Fix broken date ranges and broken "Entre" split by newline
+        text = _BROKEN_DATE_RE.sub(_fix_broken_date, text)
+
+    if has_date:
+        # STEP 5: Fix "Entre DD/MM/YYYY a [text] DD/MM/YYYY"
+        text = _ENTRE_RANGE_RE.sub(r'\1 a \3', text)
+
     # STEP 6: Collapse excessive whitespace (but preserve single line breaks for structure)
-    text = re.sub(r'[ \t]+', ' ', text)  # Collapse spaces/tabs
-    text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 consecutive newlines
-    
+    text = _WHITESPACE_RE.sub(_collapse_whitespace, text)
+
     return text.strip()
 
 
+@lru_cache(maxsize=1024)
 def parse_date_block(date_block: str) -> tuple[Optional[str], Optional[str]]:
     """
     Parse a date block into (start_iso, end_iso).
@@ -118,12 +169,14 @@ def parse_date_block(date_block: str) -> tuple[Optional[str], Optional[str]]:
     date_block = date_block.strip()
     
     # Entre ... e/a ... (check first before splitting on "a")
-    if date_block.lower().startswith("entre"):
-        dates = re.findall(r'\d{2}/\d{2}/\d{4}', date_block)
-        if len(dates) == 2:
-            return to_iso(dates[0]), to_iso(dates[1])
-        elif len(dates) == 1:
-            return to_iso(dates[0]), None
+    if date_block[:5].lower() == "entre":
+        # At most three matches are needed to tell the 1 / 2 / more cases apart
+        dates = _DATE_RE.finditer(date_block)
+        first, second, third = next(dates, None), next(dates, None), next(dates, None)
+        if second and not third:
+            return to_iso(first.group()), to_iso(second.group())
+        elif first and not second:
+            return to_iso(first.group()), None
     
     # Range using "a" (only if not an Entre phrase)
     if " a " in date_block:
@@ -135,6 +188,25 @@ def parse_date_block(date_block: str) -> tuple[Optional[str], Optional[str]]:
     return to_iso(date_block), None
 
 
+# Keyword -> event type, checked in order (first hit wins).
+# Isenção is checked BEFORE inscrição: "Isenção de inscrição" is an isenção event.
+# Homologação is intentionally NOT a separate type: it is used to find dates,
+# but we focus on inscricao/isencao.
+_EVENT_RULES = (
+    ("isen", "isencao"),        # isenção, isencao, isenç
+    ("inscri", "inscricao"),    # inscrição, inscricao, inscriçõ
+    ("prova", "prova"),
+    ("aplicac", "prova"),       # aplicação (ç folded to c)
+    ("realizac", "prova"),      # realização (ç folded to c)
+    ("resultado", "resultado"),
+    ("recurso", "recurso"),
+    ("publica", "publicacao"),
+)
+# Labels are lowercased and ç-folded once so each rule needs a single spelling
+_FOLD_CEDILLA = str.maketrans("ç", "c")
+
+
+@lru_cache(maxsize=4096)
 def classify_event(event_text: str) -> str:
     """
     Classify event type from event text.
@@ -142,37 +214,46 @@ def classify_event(event_text: str) -> str:
     
     Strategy: Identify the primary event. Isenção and Inscrição are treated equally for extraction.
     Homologação is dropped - we care about inscricao/isencao as the primary events.
+
+    Memoized: cronograma labels ("Período de inscrições", "Prova objetiva")
+    repeat heavily across editais.
     """
-    e = event_text.lower()
-    
-    # Check isenção BEFORE inscrição (both are important, but check isenção first if both present)
-    # Variations: isenção, isencao, isenç, isen
-    if "isen" in e or "isençã" in e or "isenc" in e:
-        return "isencao"
-    
-    # Then check inscrição
-    # Variations: inscrição, inscricao, inscriçõ, inscri
-    if "inscri" in e or "inscric" in e:
-        return "inscricao"
-    
-    # Prova/exam related
-    # Include variations: prova, aplicação, realização
-    if any(word in e for word in ["prova", "aplicac", "aplicaç", "realizac", "realizaç"]):
-        return "prova"
-    
-    # Other specific event types
-    if "resultado" in e:
-        return "resultado"
-    if "recurso" in e:
-        return "recurso"
-    if "publica" in e:
-        return "publicacao"
-    # Note: Homologação is intentionally NOT classified as a separate type
-    # It's used to find dates but we focus on inscricao/isencao
-    
+    e = event_text.lower().translate(_FOLD_CEDILLA)
+    for keyword, tipo in _EVENT_RULES:
+        if keyword in e:
+            return tipo
     return "outro"
 
 
+# Strategy 2 keywords: pattern -> event type
+_KEYWORD_RES = [
+    (re.compile(r'inscri[çc][õo]es?', re.IGNORECASE), 'inscricao'),
+    (re.compile(r'isen[çc][ãa]o', re.IGNORECASE), 'isencao'),
+    (re.compile(r'(?:aplica[çc][ãa]o\s+da\s+)?provas?(?:\s+objetivas?)?', re.IGNORECASE), 'prova'),
+    (re.compile(r'realiza[çc][ãa]o\s+da\s+provas?', re.IGNORECASE), 'prova'),
+]
+
+
+def _forward_dates(text: str, date_hits: list, date_starts: list, start: int, end: int):
+    """
+    Yield parsed (data_inicio, data_fim) for the dates in text[start:end].
+
+    Reuses the full-text DATE_PATTERN scan: no date match can contain a
+    keyword start, so the hits inside the window are exactly what a fresh scan
+    of the slice would find. Only a hit cut by the window end is rescanned,
+    bounded by `end`, to match the slice (e.g. a range truncated to its start).
+    """
+    for i in range(bisect_left(date_starts, start), len(date_hits)):
+        hit_start, hit_end, data_inicio, data_fim = date_hits[i]
+        if hit_start >= end:
+            return
+        if hit_end > end:
+            for date_match in DATE_PATTERN.finditer(text, hit_start, end):
+                yield parse_date_block(date_match.group(0))
+            return
+        yield data_inicio, data_fim
+
+
 def extract_all_dates(text: str) -> List[Dict]:
     """
     Extract all date events from text.
@@ -190,7 +271,14 @@ def extract_all_dates(text: str) -> List[Dict]:
     text = normalize_text(text)
     results = []
     seen_dates = set()  # Track to avoid duplicates
+
+    # Every date form contains "/": skip both scans on date-free text
+    if "/" not in text:
+        return results
     
+    # Single date scan shared by both strategies: (start, end, data_inicio, data_fim)
+    date_hits = []
+
     # Strategy 1: Find dates and look backward for context
     for match in DATE_PATTERN.finditer(text):
         date_block = match.group(0)
@@ -200,21 +288,23 @@ def extract_all_dates(text: str) -> List[Dict]:
         context_start = max(0, start_index - 150)
         context = text[context_start:start_index]
         
-        # Clean trailing fragments like portal notes
-        context = re.sub(r'Nota Informativa.*', '', context)
+        # Clean trailing fragments like portal notes (rare: test before substituting)
+        if _NOTA in context:
+            context = _NOTA_RE.sub('', context)
         context = context.strip()
         
         # Heuristic: take last sentence fragment
-        event_text = context.split(".")[-1].strip()
+        event_text = context[context.rfind(".") + 1:].strip()
         
         # Remove trailing connectors
-        event_text = re.sub(r'[:\-–]+$', '', event_text).strip()
+        event_text = event_text.rstrip(_TRAIL_CHARS).strip()
         
         # Parse dates
         data_inicio, data_fim = parse_date_block(date_block)
+        date_hits.append((start_index, match.end(), data_inicio, data_fim))
         
         if data_inicio:  # Only add if we successfully parsed at least start date
-            date_key = f"{data_inicio}|{data_fim}|{event_text[:50]}"
+            date_key = (data_inicio, data_fim, event_text[:50])
             if date_key not in seen_dates:
                 seen_dates.add(date_key)
                 results.append({
@@ -226,37 +316,26 @@ def extract_all_dates(text: str) -> List[Dict]:
     
     # Strategy 2: Keyword-based search for critical events
     # Look for keywords and find dates immediately after them
-    keywords = [
-        (r'inscri[çc][õo]es?', 'inscricao'),
-        (r'isen[çc][ãa]o', 'isencao'),
-        (r'(?:aplica[çc][ãa]o\s+da\s+)?provas?(?:\s+objetivas?)?', 'prova'),
-        (r'realiza[çc][ãa]o\s+da\s+provas?', 'prova'),
-    ]
-    
-    for keyword_pattern, tipo in keywords:
+    date_starts = [hit[0] for hit in date_hits]
+    for keyword_re, tipo in _KEYWORD_RES:
         # Find keyword occurrences
-        for kw_match in re.finditer(keyword_pattern, text, re.IGNORECASE):
+        for kw_match in keyword_re.finditer(text):
             kw_start = kw_match.start()
-            kw_text = kw_match.group(0)
             
             # Look forward up to 200 chars for dates
             context_end = min(len(text), kw_start + 200)
-            forward_context = text[kw_start:context_end]
             
             # Find dates in forward context
-            for date_match in DATE_PATTERN.finditer(forward_context):
-                date_block = date_match.group(0)
-                data_inicio, data_fim = parse_date_block(date_block)
-                
+            for data_inicio, data_fim in _forward_dates(text, date_hits, date_starts, kw_start, context_end):
                 if data_inicio:
-                    # Extract fuller event description (backward + keyword + some forward)
-                    back_start = max(0, kw_start - 50)
-                    event_text = text[back_start:kw_start + 100].strip()
-                    event_text = re.sub(r'[:\-–]+$', '', event_text).strip()
-                    
-                    date_key = f"{data_inicio}|{data_fim}|{tipo}"
+                    date_key = (data_inicio, data_fim, tipo)
                     if date_key not in seen_dates:
                         seen_dates.add(date_key)
+                        # Extract fuller event description (backward + keyword + some forward).
+                        # The key does not depend on it, so only kept events pay for the slice.
+                        back_start = max(0, kw_start - 50)
+                        event_text = text[back_start:kw_start + 100].strip()
+                        event_text = event_text.rstrip(_TRAIL_CHARS).strip()
                         results.append({
                             "evento": event_text,
                             "data_inicio": data_inicio,
@@ -268,6 +347,21 @@ def extract_all_dates(text: str) -> List[Dict]:
     return results
 
 
+# Process-local counters for profiling the parser (workers of extract_many keep
+# their own). extract_from_text counts calls/cache hits; the *_ns stages only
+# advance on cache misses: section lookup, date extraction (incl. normalize)
+# and event->field mapping.
+PARSER_STATS = {
+    "calls": 0,
+    "cache_hits": 0,
+    "sections_found": 0,
+    "section_chars": 0,
+    "section_ns": 0,
+    "extract_ns": 0,
+    "map_ns": 0,
+}
+
+
 class CronogramaParser:
     """
     Production-grade cronograma parser using semantic date extraction.
@@ -279,11 +373,64 @@ class CronogramaParser:
     4. Map to 4 essential fields
     """
 
-    def __init__(self):
-        pass
+    # Section header; the body starts on the line after it.
+    _SECTION_HEADER_RE = re.compile(r'CRONOGRAMA|DATAS?\s+IMPORTANTES?', re.IGNORECASE)
+    # Line that ends the section: next ANEXO/CAPÍTULO/numbered heading.
+    _SECTION_END_RE = re.compile(r'\n\s*(?:ANEXO|CAPÍTULO|\d+\.\s+[A-Z])', re.IGNORECASE)
+    _SECTION_MIN, _SECTION_MAX = 100, 12000
+    # Any header match contains one of these (lowercased); cheap pre-check.
+    _SECTION_KEYWORDS = ("cronograma", "importante")
+
+    @staticmethod
+    def _find_section(text: str) -> Optional[str]:
+        """
+        Return the body of the first CRONOGRAMA / DATAS IMPORTANTES section.
+
+        The body runs from the line after the header to the first line break
+        that starts an ANEXO/CAPÍTULO/numbered heading (or to the end of the
+        text), and must be 100-12000 chars long; otherwise the next header is
+        tried. Candidate line breaks are found with str.find instead of a
+        lazy bounded quantifier plus lookahead, which retried every position.
+        """
+        cls = CronogramaParser
+        size = len(text)
+        for header in cls._SECTION_HEADER_RE.finditer(text):
+            newline = text.find("\n", header.end())
+            if newline == -1:
+                return None  # no later header can have a body line either
+            start = newline + 1
+            lo = start + cls._SECTION_MIN
+            hi = min(start + cls._SECTION_MAX, size)
+            pos = text.find("\n", lo, hi + 1)
+            while pos != -1:
+                if pos == size - 1 or cls._SECTION_END_RE.match(text, pos):
+                    return text[start:pos]
+                pos = text.find("\n", pos + 1, hi + 1)
+            if lo <= size <= start + cls._SECTION_MAX:
+                return text[start:]
+        return None
+
+    @staticmethod
+    def extract_from_text(text: str) -> Dict[str, Optional[str]]:
+        """
+        Extract 4 essential cronograma fields from text.
 
+        Results are memoized per text (re-runs and multi-field callers parse
+        the same PDF text repeatedly); each call gets its own dict.
+        """
+        PARSER_STATS["calls"] += 1
+        hits = _extract_cached.cache_info().hits
+        result = dict(_extract_cached(text))
+        PARSER_STATS["cache_hits"] += _extract_cached.cache_info().hits - hits
+        return result
+
+    @classmethod
+    def extract_many(cls, texts: Iterable[str], workers: Optional[int] = None) -> List[Dict[str, Optional[str]]]:
+        """Batch form of extract_from_text over a process pool (see extract_many)."""
+        return extract_many(texts, workers=workers)
 
-    def extract_from_text(self, text: str) -> Dict[str, Optional[str]]:
+    @staticmethod
+    def _extract_uncached(text: str) -> Dict[str, Optional[str]]:
         """
         Extract 4 essential cronograma fields from text.
         
@@ -307,15 +454,17 @@ class CronogramaParser:
             return result
         
         # Try to isolate cronograma section for faster/more accurate extraction
+        t0 = time.perf_counter_ns()
         cronograma_section = None
-        cronograma_match = re.search(
-            r'(CRONOGRAMA|Cronograma|DATAS?\s+IMPORTANTES?|Datas?\s+Importantes?)[^\n]*\n([\s\S]{100,12000}?)(?=\n\s*(?:ANEXO|Anexo|CAPÍTULO|Capítulo|\d+\.\s+[A-Z])|$)',
-            text,
-            re.IGNORECASE
-        )
+        lower = text.lower()
+        if any(k in lower for k in CronogramaParser._SECTION_KEYWORDS):
+            cronograma_section = CronogramaParser._find_section(text)
+        t1 = time.perf_counter_ns()
+        PARSER_STATS["section_ns"] += t1 - t0
         
-        if cronograma_match:
-            cronograma_section = cronograma_match.group(2)
+        if cronograma_section:
+            PARSER_STATS["sections_found"] += 1
+            PARSER_STATS["section_chars"] += len(cronograma_section)
             logger.debug(f"Found cronograma section ({len(cronograma_section)} chars)")
         
         # Try section-based extraction first
@@ -329,75 +478,83 @@ class CronogramaParser:
             logger.debug("Insufficient events in section, scanning entire PDF")
             events = extract_all_dates(text)
             logger.debug(f"Extracted {len(events)} date events from full text")
+        t2 = time.perf_counter_ns()
+        PARSER_STATS["extract_ns"] += t2 - t1
         
         # Map events to our 4 essential fields
-        # Strategy: prefer keyword-based matches over generic ones
-        # First pass: process keyword-based matches (more reliable)
-        prova_range = None
-        
-        # Separate events by confidence (keyword-based vs backward-looking)
-        high_confidence = []
-        low_confidence = []
-        
+        # Strategy: prefer keyword-based matches over generic ones.
+        # High confidence (0): event text contains the actual keyword; low
+        # confidence (1): backward-looking context only, used to fill gaps.
+        # One pass keeps the first event per slot and confidence level.
+        inscricao = [None, None]
+        isencao = [None, None]
+        prova_range = [None, None]
+        prova_single = [None, None]
+
         for event in events:
-            # High confidence: event text contains the actual keyword
-            event_lower = event["evento"].lower()
-            if event["tipo"] == "inscricao" and "inscri" in event_lower:
-                high_confidence.append(event)
-            elif event["tipo"] == "isencao" and "isen" in event_lower:
-                high_confidence.append(event)
-            elif event["tipo"] == "prova" and ("prova" in event_lower or "aplica" in event_lower or "realiza" in event_lower):
-                high_confidence.append(event)
-            else:
-                low_confidence.append(event)
-        
-        # Process high confidence events first
-        for event in high_confidence:
-            tipo = event["tipo"]
-            
-            if tipo == "inscricao" and not result["inscricao_inicio"]:
-                result["inscricao_inicio"] = event["data_inicio"]
-                result["inscricao_fim"] = event["data_fim"]
-                logger.debug(f"Found inscricao (HC): {event['data_inicio']} - {event['data_fim']}")
-            
-            elif tipo == "isencao" and not result["isencao_inicio"]:
-                result["isencao_inicio"] = event["data_inicio"]
-                logger.debug(f"Found isencao (HC): {event['data_inicio']}")
-            
-            elif tipo == "prova":
-                # Prefer ranges over single dates
-                if event["data_fim"] and not prova_range:
-                    prova_range = event
-                    logger.debug(f"Found prova range (HC): {event['data_inicio']} - {event['data_fim']}")
-                elif not result["data_prova"] and not event["data_fim"]:
-                    result["data_prova"] = event["data_inicio"]
-                    logger.debug(f"Found prova single (HC): {event['data_inicio']}")
-        
-        # Then process low confidence events (only fill gaps)
-        for event in low_confidence:
             tipo = event["tipo"]
-            
-            if tipo == "inscricao" and not result["inscricao_inicio"]:
-                result["inscricao_inicio"] = event["data_inicio"]
-                result["inscricao_fim"] = event["data_fim"]
-                logger.debug(f"Found inscricao (LC): {event['data_inicio']} - {event['data_fim']}")
-            
-            elif tipo == "isencao" and not result["isencao_inicio"]:
-                result["isencao_inicio"] = event["data_inicio"]
-                logger.debug(f"Found isencao (LC): {event['data_inicio']}")
-            
+            if tipo == "inscricao":
+                slot = inscricao
+                level = 0 if "inscri" in event["evento"].lower() else 1
+            elif tipo == "isencao":
+                slot = isencao
+                level = 0 if "isen" in event["evento"].lower() else 1
             elif tipo == "prova":
                 # Prefer ranges over single dates
-                if event["data_fim"] and not prova_range:
-                    prova_range = event
-                    logger.debug(f"Found prova range (LC): {event['data_inicio']} - {event['data_fim']}")
-                elif not result["data_prova"] and not event["data_fim"]:
-                    result["data_prova"] = event["data_inicio"]
-                    logger.debug(f"Found prova single (LC): {event['data_inicio']}")
-        
+                slot = prova_range if event["data_fim"] else prova_single
+                event_lower = event["evento"].lower()
+                level = 0 if ("prova" in event_lower or "aplica" in event_lower or "realiza" in event_lower) else 1
+            else:
+                continue
+
+            if slot[level] is None:
+                slot[level] = event
+
+            if inscricao[0] and isencao[0] and prova_range[0]:
+                break  # all fields final: later events can only be lower-priority
+
+        event = inscricao[0] or inscricao[1]
+        if event:
+            result["inscricao_inicio"] = event["data_inicio"]
+            result["inscricao_fim"] = event["data_fim"]
+            logger.debug(f"Found inscricao: {event['data_inicio']} - {event['data_fim']}")
+
+        event = isencao[0] or isencao[1]
+        if event:
+            result["isencao_inicio"] = event["data_inicio"]
+            logger.debug(f"Found isencao: {event['data_inicio']}")
+
         # Use prova range if found, otherwise keep single date
-        if prova_range:
-            result["data_prova"] = prova_range["data_inicio"]
-            logger.debug(f"Using prova range start: {prova_range['data_inicio']}")
+        event = prova_range[0] or prova_range[1] or prova_single[0] or prova_single[1]
+        if event:
+            result["data_prova"] = event["data_inicio"]
+            logger.debug(f"Using prova date: {event['data_inicio']} - {event['data_fim']}")
+        PARSER_STATS["map_ns"] += time.perf_counter_ns() - t2
         
         return result
+
+
+@lru_cache(maxsize=128)
+def _extract_cached(text: str) -> tuple:
+    return tuple(CronogramaParser._extract_uncached(text).items())
+
+
+def _extract_one(text: str) -> Dict[str, Optional[str]]:
+    return CronogramaParser.extract_from_text(text)
+
+
+def extract_many(texts: Iterable[str], workers: Optional[int] = None) -> List[Dict[str, Optional[str]]]:
+    """
+    Run CronogramaParser.extract_from_text over many texts in parallel.
+
+    Parsing is pure regex/CPU work, so texts are spread over a process pool
+    (default: one worker per core). Results keep the input order.
+    With workers=1 or a single text no pool is started.
+    """
+    texts = list(texts)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(texts) <= 1:
+        return [_extract_one(text) for text in texts]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(texts))) as executor:
+        return list(executor.map(_extract_one, texts, chunksize=16))
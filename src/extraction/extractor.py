@@ -1,21 +1,16 @@
+import copy
+import os
 import re
-import json
+import hashlib
 import logging
 import unicodedata
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-try:
-    import pdfplumber
-except Exception:  # pragma: no cover - optional dependency
-    pdfplumber = None
-
-try:
-    import dateparser
-except Exception:  # pragma: no cover - optional dependency
-    dateparser = None
-
 # Try relative import first (when used as package), then absolute
 CronogramaParser = None
 try:
@@ -27,23 +22,76 @@ except ImportError:
         # Fallback se cronograma_parser não estiver disponível
         CronogramaParser = None
 
+try:
+    from src.utils.json_io import dump_json, load_json
+except ModuleNotFoundError:
+    # Support running from `python src/main.py` where `src` isn't a package root in sys.path.
+    from utils.json_io import dump_json, load_json
+
 logger = logging.getLogger(__name__)
 
 
+# pdfplumber (pdfminer + PIL) and dateparser are slow to import and only needed
+# once a PDF is read or a written-out date parsed, so they load on first use.
+@lru_cache(maxsize=None)
+def _get_pdfplumber():
+    try:
+        import pdfplumber
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return pdfplumber
+
+
+@lru_cache(maxsize=None)
+def _get_dateparser():
+    try:
+        import dateparser
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return dateparser
+
+
+@lru_cache(maxsize=None)
+def _get_fitz():
+    try:
+        import fitz  # PyMuPDF
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return fitz
+
+
+# PDF text engine: "pdfplumber" (default) or "pymupdf". PyMuPDF is several
+# times faster, but its line breaks and spacing differ from pdfplumber's, so
+# extraction results can differ; hence opt-in.
+PDF_TEXT_ENGINE = os.environ.get("DOU_PDF_TEXT_ENGINE", "pdfplumber").lower()
+
 BANCAS_WHITELIST_PATH = Path("data/bancas_whitelist.json")
 CARGOS_WHITELIST_PATH = Path("data/cargos_whitelist.json")
 
 
+@lru_cache(maxsize=16)
+def _read_whitelist(whitelist_path: Path, mtime_ns: int) -> tuple:
+    # mtime_ns is only part of the cache key: an edited file is read again
+    try:
+        data = load_json(whitelist_path)
+        if isinstance(data, list):
+            return tuple(str(x).upper() for x in data)
+    except Exception:
+        pass
+    return ()
+
+
 def _load_whitelist(whitelist_path: Path) -> List[str]:
-    if whitelist_path.exists():
-        try:
-            with whitelist_path.open(encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, list):
-                return [str(x).upper() for x in data]
-        except Exception:
-            pass
-    return []
+    try:
+        mtime_ns = whitelist_path.stat().st_mtime_ns
+    except OSError:
+        return []
+    return list(_read_whitelist(whitelist_path, mtime_ns))
+
+
+def reload_whitelists() -> None:
+    """Drop the cached whitelists so the next extraction reads them from disk."""
+    _read_whitelist.cache_clear()
 
 
 def _load_bancas_whitelist() -> List[str]:
@@ -74,24 +122,148 @@ def _load_cargos_whitelist() -> List[str]:
     return _load_whitelist(CARGOS_WHITELIST_PATH)
 
 
-def _extract_text_from_pdf(path: str) -> str:
+_BANCAS_CONHECIDAS = (
+    "CEBRASPE",
+    "FGV",
+    "FUNDAÇÃO GETULIO VARGAS",
+    "FUNDAO GETULIO VARGAS",
+    "VUNESP",
+    "IBFC",
+    "IDECAN",
+    "AOCP",
+    "QUADRIX",
+    "CONSULPLAN",
+    "FUNDATEC",
+    "IADES",
+    "FCC",
+    "FUNRIO",
+    "CESGRANRIO",
+    "CESPE",
+)
+
+
+@lru_cache(maxsize=8)
+def _bancas_matcher(bancas_whitelist: tuple):
+    """Build a single alternation over every banca so the text is scanned once.
+
+    Covers _BANCAS_CONHECIDAS plus the given whitelist. Longest names go
+    first, so "FUNDAÇÃO GETULIO VARGAS" wins over a shorter name starting at
+    the same position. Returns (pattern, {matched: banca}).
+    """
+    by_upper = {banca.upper(): banca for banca in sorted(set(_BANCAS_CONHECIDAS + bancas_whitelist))}
+    pattern = re.compile("|".join(re.escape(key) for key in sorted(by_upper, key=len, reverse=True)))
+    return pattern, by_upper
+
+
+def _extract_text_from_pdf(
+    path: str, max_pages: Optional[int] = None, parallel_pages: Optional[bool] = None
+) -> str:
     """Extract text from PDF using pdfplumber (fallback: empty string).
 
+    With DOU_PDF_TEXT_ENGINE=pymupdf, PyMuPDF is used when installed.
+    max_pages stops after the first N pages (None: whole document).
+    parallel_pages splits long PDFs across a process pool (None: follow
+    DOU_PDF_PARALLEL_PAGES); off by default, since it forks from the caller.
     If pdfplumber is not available or text extraction fails, returns empty string.
     """
+    if PDF_TEXT_ENGINE == "pymupdf":
+        fitz = _get_fitz()
+        if fitz is not None:
+            try:
+                with fitz.open(path) as doc:
+                    return "\n".join(page.get_text("text") for page in islice(doc, max_pages))
+            except Exception as e:
+                logger.exception("Failed to extract text from PDF: %s", e)
+                return ""
+        logger.warning("PyMuPDF not installed; falling back to pdfplumber")
+
+    pdfplumber = _get_pdfplumber()
     if pdfplumber is None:
         logger.warning("pdfplumber not installed; text extraction unavailable")
         return ""
 
+    if parallel_pages is None:
+        parallel_pages = PARALLEL_PAGES
     try:
-        with pdfplumber.open(path) as pdf:
-            pages = [p.extract_text() or "" for p in pdf.pages]
+        workers = 1
+        if parallel_pages:
+            page_count = _pdf_page_count(path)
+            if max_pages is not None:
+                page_count = min(page_count, max_pages)
+            workers = min(os.cpu_count() or 1, page_count // PARALLEL_MIN_PAGES)
+        if workers > 1:
+            pages = _extract_pages_parallel(path, page_count, workers)
+        else:
+            with pdfplumber.open(path) as pdf:
+                pages = [_page_text(p) for p in pdf.pages[:max_pages]]
         return "\n".join(pages)
     except Exception as e:
         logger.exception("Failed to extract text from PDF: %s", e)
         return ""
 
 
+def _page_text(page) -> str:
+    """extract_text() of one page, then release the page's parsed objects.
+
+    pdfplumber keeps every page's chars/layout cached on the (shared) page
+    list, so without this the whole parsed document stays in memory.
+    """
+    try:
+        return page.extract_text() or ""
+    finally:
+        # Page.close() in newer pdfplumber, flush_cache() in older ones
+        release = getattr(page, "close", None) or getattr(page, "flush_cache", None)
+        if release is not None:
+            release()
+
+
+# Page-level process pool for long PDFs: opt-in, because forking from a
+# threaded caller (the Flask dashboard) can deadlock, and callers that already
+# run extractions in a pool would nest one pool inside another.
+PARALLEL_PAGES = os.environ.get("DOU_PDF_PARALLEL_PAGES", "").lower() in ("1", "true", "yes")
+
+# Pages per worker below which starting a process costs more than it saves.
+PARALLEL_MIN_PAGES = 4
+
+
+def _pdf_page_count(path: str) -> int:
+    """Page count from the PDF catalog, without building pdfplumber's page list."""
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdftypes import resolve1
+
+    with open(path, "rb") as f:
+        document = PDFDocument(PDFParser(f))
+        return int(resolve1(resolve1(document.catalog["Pages"])["Count"]))
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    with _get_pdfplumber().open(path) as pdf:
+        return [_page_text(p) for p in pdf.pages[start:stop]]
+
+
+def _extract_pages_parallel(path: str, page_count: int, workers: int) -> List[str]:
+    """Run pdfminer layout analysis over contiguous page ranges in a process pool.
+
+    Each worker opens the PDF once for its range; results keep page order.
+    """
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(
+            _extract_page_range,
+            [path] * len(starts),
+            starts,
+            [start + step for start in starts],
+        )
+        return [page for chunk in chunks for page in chunk]
+
+
+# R$ followed by digits with optional thousands separator (dots) and optional
+# decimal part (comma + 2 digits); [0-9]+ also accepts "5000".
+_CURRENCY_RE = re.compile(r"R\$\s*[0-9]+(?:\.[0-9]{3})*(?:,[0-9]{2})?")
+
+
 def _find_first_currency(text: str) -> Optional[str]:
     """Extract first R$ currency amount from text.
     
@@ -108,11 +280,37 @@ def _find_first_currency(text: str) -> Optional[str]:
     # Pattern: R$ followed by digits with optional thousands separator (dots)
     # and optional decimal part (comma + 2 digits)
     # Note: [0-9]+ allows any number of starting digits to handle cases like "5000"
-    match = re.search(r"R\$\s*[0-9]+(?:\.[0-9]{3})*(?:,[0-9]{2})?", text)
-    return match.group(0) if match else None
+    # Jump between "R$" occurrences with str.find and only try the regex there.
+    i = text.find("R$")
+    while i >= 0:
+        match = _CURRENCY_RE.match(text, i)
+        if match:
+            return match.group(0)
+        i = text.find("R$", i + 2)
+    return None
+
+
+_MONTHS_PT = {
+    "janeiro": 1, "fevereiro": 2, "março": 3, "abril": 4, "maio": 5, "junho": 6,
+    "julho": 7, "agosto": 8, "setembro": 9, "outubro": 10, "novembro": 11, "dezembro": 12,
+}
+_PT_LONG_DATE_RE = re.compile(r"([0-9]{1,2})\s+de\s+(\w+)\s+de\s+([0-9]{4})")
 
 
+@lru_cache(maxsize=1024)
 def _parse_date(text: str) -> Optional[str]:
+    # Only absolute dates reach here ("10 de março de 2026"), so caching is safe
+    # "DD de <mês por extenso> de YYYY" is what the DOU header uses; build it
+    # directly and leave abbreviations and anything else to dateparser.
+    m = _PT_LONG_DATE_RE.fullmatch(text)
+    if m:
+        month = _MONTHS_PT.get(m.group(2).lower())
+        if month:
+            try:
+                return date(int(m.group(3)), month, int(m.group(1))).isoformat()
+            except ValueError:
+                pass
+    dateparser = _get_dateparser()
     if not dateparser:
         return None
     dt = dateparser.parse(text, languages=["pt"])  # supports Portuguese
@@ -121,6 +319,15 @@ def _parse_date(text: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=256)
+def _parse_dmy_groups(day: str, month: str, year: str) -> Optional[str]:
+    """ISO date from numeric DD/MM/YYYY regex groups, without dateparser."""
+    try:
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        return None
+
+
 def _title_case_pt(text: str) -> str:
     """Convert text to Title Case in Portuguese, respecting prepositions.
     
@@ -149,6 +356,31 @@ def _title_case_pt(text: str) -> str:
     return ' '.join(result)
 
 
+# Keywords that identify the edital type, in priority order
+_EDITAL_TYPE_KEYWORD_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"RETIFICAÇÃO",
+        r"HOMOLOGAÇÃO",
+        r"RESULTADO\s+FINAL",
+        r"EXTRAORDINÁRIO",
+        r"PRORROGAÇÃO",
+        r"CONVOCAÇÃO",
+        r"CANCELAMENTO",
+        r"SUSPENSÃO",
+        r"ALTERAÇÃO",
+    )
+)
+_RESULTADO_FINAL_RE = re.compile(r"\s+DO\s+RESULTADO\s+FINAL", re.IGNORECASE)
+# "EDITAL [type] Nº", e.g. EDITAL EXTRAORDINÁRIO Nº 1/2026. The type never
+# ends on whitespace, so the lazy group only stops after a non-space char;
+# letting it stop inside a run of spaces made \s* rescan the run each time.
+_EDITAL_TYPE_RE = re.compile(
+    r"EDITAL\s+(?:DE\s+ABERTURA\s+)?([A-ZÀ-Ú](?:[A-ZÀ-Ú\s\-/]*?[A-ZÀ-Ú\-/])??)\s*(?:N[ºo]\.?|$)",
+    re.IGNORECASE
+)
+
+
 def _extract_edital_type(text: str) -> Optional[str]:
     """Extract the type/purpose of edital (e.g., 'Extraordinário', 'Homologação do Resultado Final').
     
@@ -164,28 +396,15 @@ def _extract_edital_type(text: str) -> Optional[str]:
         return None
     
     # Strategy 1: Look for specific keywords that identify edital type (highest priority)
-    # These pattern keywords that indicate the type
-    keyword_patterns = [
-        r"RETIFICAÇÃO",
-        r"HOMOLOGAÇÃO",
-        r"RESULTADO\s+FINAL",
-        r"EXTRAORDINÁRIO",
-        r"PRORROGAÇÃO",
-        r"CONVOCAÇÃO",
-        r"CANCELAMENTO",
-        r"SUSPENSÃO",
-        r"ALTERAÇÃO",
-    ]
-    
-    for keyword_pattern in keyword_patterns:
-        match = re.search(keyword_pattern, text, re.IGNORECASE)
+    for keyword_re in _EDITAL_TYPE_KEYWORD_RES:
+        match = keyword_re.search(text)
         if match:
             found_keyword = match.group(0).strip()
             
             # For HOMOLOGAÇÃO, check if it's followed by "DO RESULTADO FINAL"
             if found_keyword.upper() == "HOMOLOGAÇÃO":
                 next_part = text[match.end():match.end() + 100]
-                result_match = re.match(r"\s+DO\s+RESULTADO\s+FINAL", next_part, re.IGNORECASE)
+                result_match = _RESULTADO_FINAL_RE.match(next_part)
                 if result_match:
                     return "Homologação do Resultado Final"
                 else:
@@ -198,11 +417,7 @@ def _extract_edital_type(text: str) -> Optional[str]:
     # Match: EDITAL EXTRAORDINÁRIO Nº 1/2026
     generic_types = {'de abertura', 'de abertura de', 'de seleção', 'para bolsistas', 'nº', ''}
     
-    match = re.search(
-        r"EDITAL\s+(?:DE\s+ABERTURA\s+)?([A-ZÀ-Ú][A-ZÀ-Ú\s\-/]*?)\s*(?:N[ºo]\.?|$)",
-        text,
-        re.IGNORECASE
-    )
+    match = _EDITAL_TYPE_RE.search(text)
     if match:
         edital_type = match.group(1).strip()
         if edital_type.lower() not in generic_types:
@@ -211,8 +426,93 @@ def _extract_edital_type(text: str) -> Optional[str]:
     return None
 
 
-def extract_basic_metadata(text: str) -> Dict[str, Any]:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+# extract_basic_metadata patterns, compiled once at import time.
+# Stays on stdlib re: RE2's \w is ASCII-only and would cut accented cargo and
+# órgão names short (TÉCNICO, MINISTÉRIO); none of these patterns nests
+# quantifiers, so backtracking stays linear per match attempt.
+_EDITAL_RE = re.compile(r"EDITAL", re.I)
+_ORGAO_RE = re.compile(r"(?:Órgão|Entidade)[:\s\-\n]{1,30}([A-ZÀ-Ú0-9\w\s\-/\.,]+)", re.I)
+_CARGO_RE = re.compile(r"cargo[s]?[:\s\-]{1,80}([\w\s\-\.,/()]+)", re.I)
+_CARGO_DESTINADO_RE = re.compile(
+    r"destinado a selecionar candidatos para o cargo de\s*([\w\s\-\.,/()]+)", re.I
+)
+_PROVIMENTO_RE = re.compile(r"PROVIMENTO DE\s+([A-Z\w\s\-/,()]+)", re.I)
+_BANCA_LABEL_RE = re.compile(
+    r"(organizad[oa]r|executad[oa]r|realizad[oa]r|sob responsabilidade|contratada).{0,60}por\s+([A-ZÀ-Ú][\w\s\-\.,/()]+)",
+    re.I,
+)
+_BANCA_PROPRIA_RE = re.compile(
+    r"UNIVERSIDADE|UNIVERSITÁRIO|COMISSÃO|PRÓ-?REITOR|PRÓ-REITOR|COMISSÃO EXAMINADORA|COMISSAO", re.I
+)
+_BANCA_FUNDACAO_RE = re.compile(r"FUNDAÇÃO|FUNDACAO|INSTITUTO|FUNDAÇÃO|FUNDAO", re.I)
+_FUND_INST_RE = re.compile(r"(FUNDAÇÃO|FUNDACAO|INSTITUTO)\s+[A-ZÀ-Ú0-9\w\s\-]+")
+# Searched on the uppercased text: case-sensitive matching skips the per-char
+# case folding re.I does for every alternative.
+_COMISSAO_RE = re.compile(
+    r"COMISSÃO EXAMINADORA|COMISSAO EXAMINADORA|COMISSÃO DESIGNADA|COMISSAO DESIGNADA|EXECUTADO PELA PRÓ-?REITORIA|EXECUTADO PELA PROGP"
+)
+_INSTITUICAO_RE = re.compile(r"UNIVERSIDADE|FUNDAÇÃO|INSTITUTO|MINISTÉRIO|MINISTERIO", re.I)
+_PUB_RE = re.compile(r"Publicado(?: em)?[:\s\-]{0,10}([0-9]{1,2}\s+de\s+\w+\s+de\s+[0-9]{4})", re.I)
+# The "Órgão:" label and the DOU "Publicado em" line sit in the document
+# header; searching the whole body for them only costs time on long editais.
+HEADER_WINDOW = 5000
+# extract_basic_metadata never looks past the first 40 non-blank lines
+HEAD_LINES = 40
+_HEAD_CHUNK = 8192
+
+
+def _head_lines(text: str, count: int = HEAD_LINES) -> List[str]:
+    """First `count` non-blank stripped lines, without splitting the whole text."""
+    size = _HEAD_CHUNK
+    while True:
+        parts = text[:size].splitlines()
+        if size < len(text):
+            parts.pop()  # may have been cut mid-line
+        lines = [ln for ln in map(str.strip, parts) if ln]
+        if len(lines) >= count or size >= len(text):
+            return lines[:count]
+        size *= 4
+
+
+def _extract_banca_struct(txt: str, up: str, lines: List[str]) -> Dict[str, Any]:
+    """Banca: layered strategy (known list, keyword patterns, negative heuristics)."""
+    # First banca mentioned in the text; the whitelist (dynamic) is merged
+    # with _BANCAS_CONHECIDAS once per whitelist version
+    bancas_re, bancas_by_upper = _bancas_matcher(tuple(_load_bancas_whitelist()))
+    hit = bancas_re.search(up)
+    if hit:
+        return {"nome": bancas_by_upper[hit.group(0)], "tipo": "externa", "confianca_extracao": 0.98}
+
+    label_re = _BANCA_LABEL_RE.search(txt)
+    if label_re:
+        candidate = label_re.group(2).strip()
+        if _BANCA_PROPRIA_RE.search(candidate):
+            return {"nome": candidate, "tipo": "execucao_propria", "confianca_extracao": 0.8}
+        if _BANCA_FUNDACAO_RE.search(candidate):
+            return {"nome": candidate, "tipo": "fundacao", "confianca_extracao": 0.9}
+        return {"nome": candidate, "tipo": "externa", "confianca_extracao": 0.6}
+
+    m = _FUND_INST_RE.search(up)
+    if m:
+        candidate = m.group(0).strip().title()
+        return {"nome": candidate, "tipo": "fundacao", "confianca_extracao": 0.75}
+
+    if _COMISSAO_RE.search(up):
+        inst = None
+        for ln in lines[:10]:
+            if _INSTITUICAO_RE.search(ln):
+                inst = ln
+                break
+        return {"nome": inst or "Instituição organizadora", "tipo": "execucao_propria", "confianca_extracao": 0.85}
+
+    return {"nome": None, "tipo": None, "confianca_extracao": 0.0}
+
+
+def extract_basic_metadata(text: str, text_upper: Optional[str] = None) -> Dict[str, Any]:
+    # text_upper may be passed in by callers that already uppercased the text
+    if text_upper is None:
+        text_upper = text.upper()
+    lines = _head_lines(text)
 
     metadata: Dict[str, Any] = {
         "orgao": None,
@@ -225,16 +525,14 @@ def extract_basic_metadata(text: str) -> Dict[str, Any]:
     # Try to infer 'orgao' from lines preceding an 'EDITAL' header
     orgao_val = None
     for i, ln in enumerate(lines[:40]):
-        if re.search(r"EDITAL", ln, re.I):
+        if _EDITAL_RE.search(ln):
             prev_lines = lines[max(0, i - 2) : i]
             orgao_val = " ".join(prev_lines).strip()
             if orgao_val:
                 break
 
     if not orgao_val:
-        orgao_match = re.search(
-            r"(?:Órgão|Entidade)[:\s\-\n]{1,30}([A-ZÀ-Ú0-9\w\s\-/\.,]+)", text, re.I
-        )
+        orgao_match = _ORGAO_RE.search(text, 0, HEADER_WINDOW)
         if orgao_match:
             orgao_val = orgao_match.group(1).strip()
 
@@ -247,20 +545,18 @@ def extract_basic_metadata(text: str) -> Dict[str, Any]:
 
     # cargo: look for explicit 'cargo' label or common wording
     cargo_val = None
-    cargo_match = re.search(r"cargo[s]?[:\s\-]{1,80}([\w\s\-\.,/()]+)", text, re.I)
+    cargo_match = _CARGO_RE.search(text)
     if cargo_match:
         cargo_val = cargo_match.group(1).strip()
     else:
-        m = re.search(
-            r"destinado a selecionar candidatos para o cargo de\s*([\w\s\-\.,/()]+)", text, re.I
-        )
+        m = _CARGO_DESTINADO_RE.search(text)
         if m:
             cargo_val = m.group(1).strip()
         else:
             for i, ln in enumerate(lines[:20]):
-                if re.search(r"EDITAL", ln, re.I):
+                if _EDITAL_RE.search(ln):
                     nxt = " ".join(lines[i : i + 6])
-                    mm = re.search(r"PROVIMENTO DE\s+([A-Z\w\s\-/,()]+)", nxt, re.I)
+                    mm = _PROVIMENTO_RE.search(nxt)
                     if mm:
                         cargo_val = mm.group(1).strip()
                     break
@@ -280,11 +576,11 @@ def extract_basic_metadata(text: str) -> Dict[str, Any]:
     
     # Fallback: If no cargo found, search for whitelisted cargos in text
     if not cargo_val and cargos_whitelist:
-        text_upper = text.upper()
         # Search for whitelisted cargos in the first 3000 chars
         search_text = text_upper[:3000]
         for whitelisted_cargo in cargos_whitelist:
-            if whitelisted_cargo.upper() in search_text:
+            # entries are already uppercased by _load_whitelist
+            if whitelisted_cargo in search_text:
                 # Found a whitelisted cargo in the text
                 cargo_val = whitelisted_cargo.title()
                 logger.debug(f"Cargo found via whitelist fallback: {cargo_val}")
@@ -293,77 +589,79 @@ def extract_basic_metadata(text: str) -> Dict[str, Any]:
     metadata["cargo"] = cargo_val
 
     # Banca: layered strategy (known list, keyword patterns, negative heuristics)
-    def extract_banca_struct(txt: str) -> Dict[str, Any]:
-        # Load bancas from whitelist (dynamic) and merge with hardcoded list
-        bancas_whitelist = _load_bancas_whitelist()
-        
-        BANCAS_CONHECIDAS = [
-            "CEBRASPE",
-            "FGV",
-            "FUNDAÇÃO GETULIO VARGAS",
-            "FUNDAO GETULIO VARGAS",
-            "VUNESP",
-            "IBFC",
-            "IDECAN",
-            "AOCP",
-            "QUADRIX",
-            "CONSULPLAN",
-            "FUNDATEC",
-            "IADES",
-            "FCC",
-            "FUNRIO",
-            "CESGRANRIO",
-            "CESPE",
-        ]
-        
-        # Merge whitelist with hardcoded list (deduplicate)
-        all_bancas = list(set(BANCAS_CONHECIDAS + bancas_whitelist))
+    metadata["banca"] = _extract_banca_struct(text, text_upper, lines)
 
-        up = txt.upper()
+    pub_match = _PUB_RE.search(text, 0, HEADER_WINDOW)
+    if pub_match:
+        metadata["data_publicacao_dou"] = _parse_date(pub_match.group(1))
 
-        for banca in all_bancas:
-            if banca.upper() in up:
-                return {"nome": banca, "tipo": "externa", "confianca_extracao": 0.98}
+    return metadata
 
-        label_re = re.search(
-            r"(organizad[oa]r|executad[oa]r|realizad[oa]r|sob responsabilidade|contratada).{0,60}por\s+([A-ZÀ-Ú][\w\s\-\.,/()]+)",
-            txt,
-            re.I,
-        )
-        if label_re:
-            candidate = label_re.group(2).strip()
-            if re.search(r"UNIVERSIDADE|UNIVERSITÁRIO|COMISSÃO|PRÓ-?REITOR|PRÓ-REITOR|COMISSÃO EXAMINADORA|COMISSAO", candidate, re.I):
-                return {"nome": candidate, "tipo": "execucao_propria", "confianca_extracao": 0.8}
-            if re.search(r"FUNDAÇÃO|FUNDACAO|INSTITUTO|FUNDAÇÃO|FUNDAO", candidate, re.I):
-                return {"nome": candidate, "tipo": "fundacao", "confianca_extracao": 0.9}
-            return {"nome": candidate, "tipo": "externa", "confianca_extracao": 0.6}
-
-        m = re.search(r"(FUNDAÇÃO|FUNDACAO|INSTITUTO)\s+[A-ZÀ-Ú0-9\w\s\-]+", up)
-        if m:
-            candidate = m.group(0).strip().title()
-            return {"nome": candidate, "tipo": "fundacao", "confianca_extracao": 0.75}
-
-        if re.search(r"COMISSÃO EXAMINADORA|COMISSAO EXAMINADORA|COMISSÃO DESIGNADA|COMISSAO DESIGNADA|EXECUTADO PELA PRÓ-?REITORIA|EXECUTADO PELA PROGP", txt, re.I):
-            inst = None
-            for ln in lines[:10]:
-                if re.search(r"UNIVERSIDADE|FUNDAÇÃO|INSTITUTO|MINISTÉRIO|MINISTERIO", ln, re.I):
-                    inst = ln
-                    break
-            return {"nome": inst or "Instituição organizadora", "tipo": "execucao_propria", "confianca_extracao": 0.85}
 
-        return {"nome": None, "tipo": None, "confianca_extracao": 0.0}
 
-    metadata["banca"] = extract_banca_struct(text)
 
-    pub_match = re.search(r"Publicado(?: em)?[:\s\-]{0,10}([0-9]{1,2}\s+de\s+\w+\s+de\s+[0-9]{4})", text, re.I)
-    if pub_match:
-        metadata["data_publicacao_dou"] = _parse_date(pub_match.group(1))
 
-    return metadata
+# ETAPA 2 fallback patterns, compiled once at import time.
+_CRONOGRAMA_HEADER_RE = re.compile(r"CRONOGRAMA|DATAS\s+IMPORTANTES", re.I)
+_CRONOGRAMA_END_RE = re.compile(r"\n(?:ANEXO|$)", re.I)
+_LETTER_RE = re.compile(r"[a-z]", re.I)
+_CRONOGRAMA_SECTION_MAX = 8000
+
 
+def _find_cronograma_section(text: str) -> Optional[str]:
+    """Text between a CRONOGRAMA / DATAS IMPORTANTES header and the next
+    line starting with ANEXO (or the end of the text), at most 8000 chars.
 
+    Gives the same section as the former single lazy regex, without retrying
+    8000 lazy steps for every header that has no end in reach: the end is
+    located once, and the section may only start past the header when
+    everything skipped contains no letters.
+    """
+    end = None
+    for header in _CRONOGRAMA_HEADER_RE.finditer(text):
+        start = header.end()
+        if end is None or end.start() < start:
+            end = _CRONOGRAMA_END_RE.search(text, start)
+            if end is None:
+                return None
+        stop = end.start()
+        section_start = max(start, stop - _CRONOGRAMA_SECTION_MAX)
+        if section_start == start or not _LETTER_RE.search(text, start, section_start):
+            return text[section_start:stop]
+    return None
 
 
+# "\s*(?:[:\-]\s*)?" rather than "\s*[:\-]?\s*": two adjacent \s* split a long
+# run of spaces every possible way before failing (quadratic).
+# Inscrição (período)
+_INSCR_RES = tuple(
+    re.compile(pattern, re.I)
+    for pattern in (
+        r"Recebimento de Inscrições?\s*(?:[:\-]\s*)?(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})\s+(?:a|ate|até)\s+(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
+        r"Período de Inscrição\s*(?:[:\-]\s*)?(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})\s+(?:a|ate|até)\s+(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
+    )
+)
+# Isenção (período de solicitação)
+_ISENCAO_RES = tuple(
+    re.compile(pattern, re.I)
+    for pattern in (
+        r"Período de solicitação de isenção?\s*(?:[:\-]\s*)?(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
+        r"Solicitação de isenção?\s*(?:[:\-]\s*)?(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
+    )
+)
+# Every fallback pattern needs a numeric date; when the section has none the
+# seven pattern scans below can all be skipped.
+_NUMERIC_DATE_RE = re.compile(r"(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})")
+# Provas
+_PROVA_RES = tuple(
+    re.compile(pattern, re.I)
+    for pattern in (
+        r"Data provável (?:das|da) provas?\s*(?:[:\-]\s*)?(?:Entre\s+)?(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
+        r"Data (?:das|da) provas?\s*(?:[:\-]\s*)?(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
+        r"Realização (?:das|da) provas?\s*(?:[:\-]\s*)?(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
+    )
+)
+
 
 def extract_cronograma(text: str, pdf_path: str = None) -> Dict[str, Optional[str]]:
     """Extract 3 essential cronograma dates:
@@ -412,27 +710,23 @@ def extract_cronograma(text: str, pdf_path: str = None) -> Dict[str, Optional[st
     logger.debug("ETAPA 2: Fallback regex patterns")
     
     # Find cronograma section to reduce noise
-    cronograma_section = text
-    cronograma_match = re.search(
-        r"(CRONOGRAMA|Cronograma|DATAS\s+IMPORTANTES|Datas\s+Importantes)[^a-z]*?([\s\S]{0,8000}?)(?=\n(?:ANEXO|Anexo|$))",
-        text, re.I
-    )
-    if cronograma_match:
-        cronograma_section = cronograma_match.group(2)
+    cronograma_section = _find_cronograma_section(text)
+    if cronograma_section is None:
+        cronograma_section = text
+    else:
         logger.debug(f"Found cronograma section ({len(cronograma_section)} chars)")
+
+    if not _NUMERIC_DATE_RE.search(cronograma_section):
+        logger.debug("ETAPA 2 result: no numeric dates in section")
+        return cronograma
     
     # Pattern 1: Inscrição (período)
-    inscr_patterns = [
-        r"Recebimento de Inscrições?\s*[:\-]?\s*(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})\s+(?:a|ate|até)\s+(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
-        r"Período de Inscrição\s*[:\-]?\s*(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})\s+(?:a|ate|até)\s+(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
-    ]
-    
-    for pattern in inscr_patterns:
-        inscr_match = re.search(pattern, cronograma_section, re.I)
+    for pattern in _INSCR_RES:
+        inscr_match = pattern.search(cronograma_section)
         if inscr_match:
             try:
-                start_iso = _parse_date(f"{inscr_match.group(1)}/{inscr_match.group(2)}/{inscr_match.group(3)}")
-                end_iso = _parse_date(f"{inscr_match.group(4)}/{inscr_match.group(5)}/{inscr_match.group(6)}")
+                start_iso = _parse_dmy_groups(*inscr_match.group(1, 2, 3))
+                end_iso = _parse_dmy_groups(*inscr_match.group(4, 5, 6))
                 if start_iso:
                     cronograma["inscricao_inicio"] = start_iso
                 if end_iso:
@@ -442,16 +736,11 @@ def extract_cronograma(text: str, pdf_path: str = None) -> Dict[str, Optional[st
                 pass
     
     # Pattern 2: Isenção (período de solicitação)
-    isencao_patterns = [
-        r"Período de solicitação de isenção?\s*[:\-]?\s*(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
-        r"Solicitação de isenção?\s*[:\-]?\s*(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
-    ]
-    
-    for pattern in isencao_patterns:
-        isencao_match = re.search(pattern, cronograma_section, re.I)
+    for pattern in _ISENCAO_RES:
+        isencao_match = pattern.search(cronograma_section)
         if isencao_match:
             try:
-                iso = _parse_date(f"{isencao_match.group(1)}/{isencao_match.group(2)}/{isencao_match.group(3)}")
+                iso = _parse_dmy_groups(*isencao_match.group(1, 2, 3))
                 if iso:
                     cronograma["isencao_inicio"] = iso
                 break
@@ -459,17 +748,11 @@ def extract_cronograma(text: str, pdf_path: str = None) -> Dict[str, Optional[st
                 pass
     
     # Pattern 3: Provas
-    prova_patterns = [
-        r"Data provável (?:das|da) provas?\s*[:\-]?\s*(?:Entre\s+)?(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
-        r"Data (?:das|da) provas?\s*[:\-]?\s*(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
-        r"Realização (?:das|da) provas?\s*[:\-]?\s*(\d{1,2})[./\-](\d{1,2})[./\-](\d{4})",
-    ]
-    
-    for pattern in prova_patterns:
-        prova_match = re.search(pattern, cronograma_section, re.I)
+    for pattern in _PROVA_RES:
+        prova_match = pattern.search(cronograma_section)
         if prova_match:
             try:
-                iso = _parse_date(f"{prova_match.group(1)}/{prova_match.group(2)}/{prova_match.group(3)}")
+                iso = _parse_dmy_groups(*prova_match.group(1, 2, 3))
                 if iso:
                     cronograma["data_prova"] = iso
                 break
@@ -482,6 +765,14 @@ def extract_cronograma(text: str, pdf_path: str = None) -> Dict[str, Optional[st
 
 
 
+_TOTAL_VAGAS_RE = re.compile(r"(?:Total de vagas|Vagas totais|Vagas)[:\s\-]{0,10}([0-9]+)", re.I)
+_VAGAS_NEAR_RE = re.compile(r"Vagas?[^\d]{0,10}([0-9]{1,4})", re.I)
+_PCD_RE = re.compile(r"PCD[:\s\-]{0,10}([0-9]+)", re.I)
+# PPI / PPIQ patterns (various spellings)
+_PPIQ_RE = re.compile(r"PPIQ|PPI|Pretos\s+Pardos|Indígenas", re.I)
+_SMALL_NUMBER_RE = re.compile(r"([0-9]{1,3})")
+
+
 def extract_vagas(text: str) -> Dict[str, Optional[int]]:
     vagas = {
         "total": None,
@@ -491,26 +782,26 @@ def extract_vagas(text: str) -> Dict[str, Optional[int]]:
     }
 
     # try patterns
-    total_match = re.search(r"(?:Total de vagas|Vagas totais|Vagas)[:\s\-]{0,10}([0-9]+)", text, re.I)
+    total_match = _TOTAL_VAGAS_RE.search(text)
     if total_match:
         vagas["total"] = int(total_match.group(1))
     else:
         # fallback: first occurrence of 'Vagas' with number nearby
-        m = re.search(r"Vagas?[^\d]{0,10}([0-9]{1,4})", text, re.I)
+        m = _VAGAS_NEAR_RE.search(text)
         if m:
             vagas["total"] = int(m.group(1))
 
-    pcd_match = re.search(r"PCD[:\s\-]{0,10}([0-9]+)", text, re.I)
+    pcd_match = _PCD_RE.search(text)
     if pcd_match:
         pcd_val = int(pcd_match.group(1))
         vagas["pcd"] = pcd_val
 
     # PPI / PPIQ patterns (various spellings)
-    ppiq_match = re.search(r"PPIQ|PPI|Pretos\s+Pardos|Indígenas", text, re.I)
+    ppiq_match = _PPIQ_RE.search(text)
     if ppiq_match:
         # try to get number near the keyword
         nearby = text[ppiq_match.start():ppiq_match.start()+60]
-        nm = re.search(r"([0-9]{1,3})", nearby)
+        nm = _SMALL_NUMBER_RE.search(nearby)
         if nm:
             vagas["ppiq"] = int(nm.group(1))
 
@@ -526,6 +817,13 @@ def extract_vagas(text: str) -> Dict[str, Optional[int]]:
     return vagas
 
 
+_REM_RE = re.compile(
+    r"(Remunera[cç][aã]o|Remuneraçao|Remuneração inicial|Vencimento)[:\s\-]{0,30}([Rr]\$\s*[0-9\.,]+)", re.I
+)
+_REM_KW_RE = re.compile(r"remuner|vencim|sal[aá]rio", re.I)
+_LOOSE_CURRENCY_RE = re.compile(r"R\$\s*[0-9\.,]+")
+
+
 def extract_financeiro(text: str) -> Dict[str, Optional[Any]]:
     financeiro = {
         "taxa_inscricao": None,
@@ -535,34 +833,167 @@ def extract_financeiro(text: str) -> Dict[str, Optional[Any]]:
     taxa = _find_first_currency(text)
     if taxa:
         financeiro["taxa_inscricao"] = taxa
+    elif "R$" not in text and "r$" not in text:
+        # Both remuneration patterns below need an R$ amount
+        return financeiro
 
     # remuneration: look for 'Remuneração' or 'Vencimento' near currency
-    rem_match = re.search(r"(Remunera[cç][aã]o|Remuneraçao|Remuneração inicial|Vencimento)[:\s\-]{0,30}([Rr]\$\s*[0-9\.,]+)", text, re.I)
+    rem_match = _REM_RE.search(text)
     if rem_match:
         financeiro["remuneracao_inicial"] = rem_match.group(2)
     else:
         # fallback: any currency that appears after words like 'remunera' in a larger window
-        rem_kw = re.search(r"remuner|vencim|sal[aá]rio", text, re.I)
+        rem_kw = _REM_KW_RE.search(text)
         if rem_kw:
             window = text[rem_kw.start():rem_kw.start()+200]
-            m = re.search(r"R\$\s*[0-9\.,]+", window)
+            m = _LOOSE_CURRENCY_RE.search(window)
             if m:
                 financeiro["remuneracao_inicial"] = m.group(0)
 
     return financeiro
 
 
-def extract_from_pdf(path: str) -> Dict[str, Any]:
+# What the four extractors return for an empty text
+_EMPTY_RESULT = {
+    "metadata": {
+        "orgao": None,
+        "edital_numero": None,
+        "cargo": None,
+        "banca": {"nome": None, "tipo": None, "confianca_extracao": 0.0},
+        "data_publicacao_dou": None,
+    },
+    "vagas": {"total": None, "ampla_concorrencia": None, "pcd": None, "ppiq": None},
+    "financeiro": {"taxa_inscricao": None, "remuneracao_inicial": None},
+    "cronograma": {"inscricao_inicio": None, "inscricao_fim": None, "isencao_inicio": None, "data_prova": None},
+}
+
+
+# Own subdirectory: pruning deletes every *.json in it (the review CLI caches
+# under .cache/review).
+EXTRACTION_CACHE_DIR = Path("data/summaries/.cache/extraction")
+# Bump when the extraction logic changes so cached results are recomputed.
+EXTRACTION_CACHE_VERSION = 1
+# Least recently used entries beyond this are deleted on write; whitelist
+# edits and version bumps orphan every older entry.
+EXTRACTION_CACHE_MAX_ENTRIES = 2000
+
+
+def _resolved_text_engine() -> str:
+    """The engine _extract_text_from_pdf will actually use."""
+    if PDF_TEXT_ENGINE == "pymupdf" and _get_fitz() is not None:
+        return "pymupdf"
+    return "pdfplumber"
+
+
+def _extraction_cache_key(path: str, max_pages: Optional[int] = None) -> Optional[str]:
+    """sha256 of the PDF bytes, the whitelist mtimes, the resolved text engine,
+    which optional dependencies are available, max_pages and
+    EXTRACTION_CACHE_VERSION."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    # Whitelist edits change banca/cargo results, so they invalidate the cache
+    for whitelist_path in (BANCAS_WHITELIST_PATH, CARGOS_WHITELIST_PATH):
+        try:
+            mtime_ns = whitelist_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        digest.update(f"|{whitelist_path}:{mtime_ns}".encode())
+    # Results degraded by a missing dependency must not outlive its install
+    dependencies = (
+        f"pdfplumber={_get_pdfplumber() is not None}"
+        f",dateparser={_get_dateparser() is not None}"
+    )
+    digest.update(
+        f"|{_resolved_text_engine()}|{dependencies}|{max_pages}|v{EXTRACTION_CACHE_VERSION}".encode()
+    )
+    return digest.hexdigest()
+
+
+def _read_cached_extraction(key: str) -> Optional[Dict[str, Any]]:
+    cache_path = EXTRACTION_CACHE_DIR / f"{key}.json"
+    try:
+        data = load_json(cache_path)
+    except (OSError, ValueError):
+        return None
+    try:
+        # mtime tracks last use, so pruning drops the least recently used
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return data
+
+
+def _prune_extraction_cache() -> None:
+    entries = []
+    try:
+        with os.scandir(EXTRACTION_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except OSError:
+                        pass
+    except OSError:
+        return
+    if len(entries) <= EXTRACTION_CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, stale_path in entries[: len(entries) - EXTRACTION_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(stale_path)
+        except OSError:
+            pass
+
+
+def _write_cached_extraction(key: str, data: Dict[str, Any]) -> None:
+    try:
+        EXTRACTION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = EXTRACTION_CACHE_DIR / f"{key}.json"
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        dump_json(data, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write extraction cache: %s", e)
+        return
+    _prune_extraction_cache()
+
+
+def extract_from_pdf(
+    path: str,
+    use_cache: bool = True,
+    max_pages: Optional[int] = None,
+    parallel_pages: Optional[bool] = None,
+) -> Dict[str, Any]:
     """Main entry point: given a PDF path, return a normalized JSON-like dict with extracted fields.
 
     The function is intentionally conservative: it returns None for fields not found.
+    Results are cached in EXTRACTION_CACHE_DIR by PDF content hash, so an
+    unchanged PDF is not parsed again (use_cache=False forces a fresh run).
+    max_pages limits text extraction to the first N pages; vagas tables and
+    cronogramas can sit deep in long editais, so the default reads them all.
+    parallel_pages is passed on to _extract_text_from_pdf.
     """
-    text = _extract_text_from_pdf(path)
+    cache_key = _extraction_cache_key(path, max_pages) if use_cache else None
+    if cache_key:
+        cached = _read_cached_extraction(cache_key)
+        if cached is not None:
+            logger.debug("Extraction cache hit for %s", path)
+            return cached
+
+    text = _extract_text_from_pdf(path, max_pages, parallel_pages)
 
     if not text:
         logger.warning("No text extracted from PDF %s", path)
+        # Nothing to extract; not cached either, since an empty text usually
+        # means pdfplumber is missing or failed
+        return copy.deepcopy(_EMPTY_RESULT)
 
-    metadata = extract_basic_metadata(text)
+    metadata = extract_basic_metadata(text, text.upper())
     cronograma = extract_cronograma(text, pdf_path=path)
     vagas = extract_vagas(text)
     financeiro = extract_financeiro(text)
@@ -574,13 +1005,20 @@ def extract_from_pdf(path: str) -> Dict[str, Any]:
         "cronograma": cronograma,
     }
 
+    if cache_key:
+        _write_cached_extraction(cache_key, out)
+
     return out
 
 
+_DOCUMENT_ID_RE = re.compile(r"(\d{6,})$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _extract_document_id(value: str) -> str:
     if not value:
         return ""
-    match = re.search(r"(\d{6,})$", value)
+    match = _DOCUMENT_ID_RE.search(value)
     return match.group(1) if match else ""
 
 
@@ -589,7 +1027,7 @@ def _normalize_text(value: Any) -> str:
     no_accents = "".join(
         ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch)
     )
-    return re.sub(r"\s+", " ", no_accents)
+    return _WHITESPACE_RE.sub(" ", no_accents)
 
 
 def _identity_key_from_payload(payload: Dict[str, Any]) -> str:
@@ -607,8 +1045,7 @@ def _identity_key_from_payload(payload: Dict[str, Any]) -> str:
 
 def _identity_key_from_file(path: Path) -> str:
     try:
-        with path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)
+        payload = load_json(path)
         if isinstance(payload, dict):
             return _identity_key_from_payload(payload)
     except Exception:
@@ -622,11 +1059,15 @@ def save_extraction_json(
     source_url_title: str | None = None,
     source_pdf_filename: str | None = None,
     pdf_persisted: bool = True,
+    extracted: Dict[str, Any] | None = None,
 ) -> str:
-    import os
+    """Extract `path_pdf` and save it as the canonical summary JSON in `out_dir`.
 
+    `extracted` takes an extract_from_pdf result computed elsewhere (e.g. in a
+    worker process) instead of extracting again.
+    """
     os.makedirs(out_dir, exist_ok=True)
-    data = extract_from_pdf(path_pdf)
+    data = extracted if extracted is not None else extract_from_pdf(path_pdf)
     base = os.path.splitext(os.path.basename(path_pdf))[0]
     source_title = (source_url_title or base).strip()
     document_id = _extract_document_id(source_title)
@@ -654,8 +1095,7 @@ def save_extraction_json(
     )
     data["_source"] = source_block
 
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    dump_json(data, out_path)
 
     # Smart cleanup: remove older/alternate files for the same document.
     current_identity = _identity_key_from_payload(data)
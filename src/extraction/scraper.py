@@ -1,15 +1,17 @@
-from bs4 import BeautifulSoup
-
 import json
 import re
+from functools import lru_cache
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from src.config.dou_urls import get_dou_config
+    from src.utils.json_io import loads
 except ModuleNotFoundError:
     # Support running from `python src/main.py` where `src` isn't a package root in sys.path.
     from config.dou_urls import get_dou_config
+    from utils.json_io import loads
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
@@ -20,6 +22,68 @@ HEADERS = {
     'Upgrade-Insecure-Requests': '1'
 }
 
+# Retry policy formerly hand-rolled in scrape_concursos: up to 5 attempts with
+# exponential backoff on connection errors, timeouts and 5xx. 4xx is not retried.
+MAX_RETRIES = 5
+
+
+def _build_session(retry=None) -> requests.Session:
+    if retry is None:
+        retry = Retry(
+            total=MAX_RETRIES - 1,
+            backoff_factor=1,
+            status_forcelist=tuple(range(500, 600)),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+
+# Shared so TCP/TLS connections to in.gov.br are reused across requests.
+_SESSION = _build_session()
+
+# Single attempt, no retries: the resolver runs inside dashboard requests and
+# once per summary in backfills, where a 5x retry would stall the caller.
+_RESOLVER_SESSION = _build_session(retry=0)
+
+# The search results are embedded as JSON in this script tag, not as HTML links.
+_PARAMS_SCRIPT_RE = re.compile(
+    r'<script\b[^>]*\bid=["\']_br_com_seatecnologia_in_buscadou_BuscaDouPortlet_params["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _find_params_json(html: str) -> str | None:
+    """Return the raw JSON text of the search-results script tag, if present."""
+    match = _PARAMS_SCRIPT_RE.search(html)
+    return match.group(1) if match else None
+
+# Search highlights wrap matches in <span>; repeated highlights duplicate words.
+_SPAN_RE = re.compile(r'<span[^>]*>(.*?)</span>')
+
+
+# Titles repeat across searches (same edital, recurring boilerplate headings).
+@lru_cache(maxsize=8192)
+def clean_title(title: str) -> str:
+    """Strip highlight <span> tags and drop consecutive duplicate words (case-insensitive)."""
+    if '<span' in title:
+        # Only back-to-back spans ("CONCURSO</span><span>CONCURSO") get a space
+        # between them; a highlight next to punctuation or inside a word stays attached.
+        title = _SPAN_RE.sub(r'\1', title.replace('</span><span', '</span> <span'))
+    words = []
+    prev = None
+    for word in title.split():
+        lowered = word.lower()
+        if lowered != prev:
+            words.append(word)
+            prev = lowered
+    return ' '.join(words)
+
 
 def resolve_url_title_by_document_id(document_id: str, do_type: str = 'do3') -> str | None:
     """
@@ -37,14 +101,13 @@ def resolve_url_title_by_document_id(document_id: str, do_type: str = 'do3') ->
     url = f"{search_base_url}?q={doc_id}&s={do_type}&sortType=0"
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=20)
+        response = _RESOLVER_SESSION.get(url, timeout=20)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        params_script = soup.find('script', {'id': '_br_com_seatecnologia_in_buscadou_BuscaDouPortlet_params'})
-        if not params_script or not params_script.string:
+        params_json = _find_params_json(response.text)
+        if not params_json:
             return None
 
-        data = json.loads(params_script.string)
+        data = loads(params_json)
         results = data.get('jsonArray', [])
         first_url_title = None
         for result in results:
@@ -90,64 +153,42 @@ def scrape_concursos(start_date, end_date, do_type='do3') -> list[dict]:
         f"&exactDate=personalizado&sortType=0&publishFrom={start_date}&publishTo={end_date}"
     )
 
-    # Add retry logic with timeout
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, headers=HEADERS, timeout=30)
-            response.raise_for_status()
-            break
-        except requests.exceptions.HTTPError as e:
-            # Retry on 5xx server errors, don't retry on 4xx client errors
-            if 500 <= response.status_code < 600:
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt)  # Exponential backoff: 1s, 2s, 4s, 8s, 16s
-                    print(f"Server error ({response.status_code}). Retrying in {wait_time} seconds... (Attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                else:
-                    print(f"Server error ({response.status_code}) persisted after {max_retries} attempts")
-                    dou_config.record_component_failure("search")
-                    return []
-            else:
-                # Don't retry on client errors (4xx)
-                print(f"Client error ({response.status_code}): {e}")
-                dou_config.record_component_failure("search")
-                return []
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-            if attempt < max_retries - 1:
-                wait_time = (2 ** attempt)  # Exponential backoff: 1s, 2s, 4s, 8s, 16s
-                print(f"Connection failed: {type(e).__name__}. Retrying in {wait_time} seconds... (Attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-            else:
-                print(f"Failed after {max_retries} attempts: {e}")
-                dou_config.record_component_failure("search")
-                return []
-
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # The search results are embedded as JSON in a script tag, not as HTML links
-    # Find the script tag containing the JSON data
-    params_script = soup.find('script', {'id': '_br_com_seatecnologia_in_buscadou_BuscaDouPortlet_params'})
-
-    if not params_script:
+    # Retries with backoff are handled by the session adapter (see _build_session)
+    try:
+        response = _SESSION.get(url, timeout=30)
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as e:
+        if 500 <= response.status_code < 600:
+            print(f"Server error ({response.status_code}) persisted after {MAX_RETRIES} attempts")
+        else:
+            # Client errors (4xx) are not retried
+            print(f"Client error ({response.status_code}): {e}")
+        dou_config.record_component_failure("search")
+        return []
+    except requests.exceptions.RequestException as e:
+        print(f"Failed after {MAX_RETRIES} attempts: {e}")
+        dou_config.record_component_failure("search")
+        return []
+
+    # The search results are embedded as JSON in a script tag, not as HTML links.
+    # Pull that tag's text directly instead of building a DOM of the whole page.
+    params_json = _find_params_json(response.text)
+
+    if params_json is None:
         print("Error: Could not find results JSON in page")
         dou_config.record_component_failure("search")
         return []
 
     # Parse the JSON data
     try:
-        data = json.loads(params_script.string)
+        data = loads(params_json)
         results = data.get('jsonArray', [])
 
         # Return a list of dicts with the title, date, edition, section, and URL of each concurso found in the search results.
         concursos = []
         for result in results:
             url_title = result.get('urlTitle', '')
-            title = result.get('title', '')
-            # Extract content from HTML span tags and remove the tags
-            title = re.sub(r'<span[^>]*>(.*?)</span>', r'\1', title)
-            # Remove consecutive duplicate words (case-insensitive)
-            title = re.sub(r'(\w+)(?:\s*\1)+', r'\1', title, flags=re.IGNORECASE)
+            title = clean_title(result.get('title', ''))
             pub_date = result.get('pubDate', '')
             edition = result.get('editionNumber', '')
             pub_name = result.get('pubName', '')
@@ -1,10 +1,11 @@
 import argparse
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from extraction.scraper import scrape_concursos, resolve_url_title_by_document_id
-from extraction.extractor import save_extraction_json
+from extraction.extractor import extract_from_pdf, save_extraction_json
 from utils.dou_url_utils import (
     is_invalid_year_number_slug,
     is_legacy_truncated_slug,
@@ -207,44 +208,70 @@ def backfill_url_titles_in_summaries(summaries_dir: Path, dry_run: bool = False,
     return stats
 
 
+# A extração (pdfminer) é CPU-bound: roda em processos enquanto o navegador
+# baixa os próximos PDFs. Limite baixo para não saturar o disco.
+# Cada worker extrai um PDF inteiro em série (parallel_pages=False): um pool
+# de páginas dentro de cada worker multiplicaria os processos.
+EXTRACTION_WORKERS = min(os.cpu_count() or 1, 8)
+
+
+def _save_extractions(pending):
+    """Grava os JSONs na ordem do lote (a limpeza de duplicatas não é concorrente)."""
+    for concurso, pdf_path, future in pending:
+        try:
+            out_json = save_extraction_json(
+                pdf_path,
+                source_url_title=concurso.get("url_title"),
+                source_pdf_filename=f"{concurso['url_title']}.pdf",
+                pdf_persisted=True,
+                extracted=future.result(),
+            )
+            print(f"Extracao salva em {out_json}")
+        except Exception as ex:
+            print(f"Aviso: extracao falhou ({concurso['url_title']}): {ex}")
+
+
 def process_abertura_concursos(abertura_concursos, export_pdf):
     errors = 0
     processed = 0
+    pdf_results = None
+    import_error = None
+    executor = None
+    pending = []
+
+    if export_pdf:
+        try:
+            # Import tardio para não exigir Playwright no modo preview.
+            from export.pdf_export import save_concurso_pdfs
+            # Um único navegador/página para todos os PDFs do lote.
+            pdf_results = save_concurso_pdfs(abertura_concursos)
+        except Exception as e:
+            import_error = e
+        else:
+            executor = ProcessPoolExecutor(max_workers=EXTRACTION_WORKERS)
 
     for concurso in abertura_concursos:
         processed += 1
         # Sempre mostra o título; no modo preview não persiste artefatos.
         print(f"Titulo:  {concurso['title']}")
         if export_pdf:
-            try:
-                # Import tardio para não exigir Playwright no modo preview.
-                from export.pdf_export import save_concurso_pdf
-            except Exception as e:
+            if pdf_results is None:
                 errors += 1
-                print(f"Erro ao importar Playwright/pdf_export: {e}")
+                print(f"Erro ao importar Playwright/pdf_export: {import_error}")
                 print("Exportacao de PDF indisponivel; instale o Playwright ou execute sem --export-pdf.")
                 continue
 
             try:
-                result = save_concurso_pdf(concurso)
+                result = next(pdf_results)
                 # Verifica se o resultado retornou mensagem de erro.
                 if isinstance(result, str) and result.startswith("Error"):
                     errors += 1
                     print(result)
                 else:
                     print(result)
-                    # Após salvar o PDF, tenta a extração para JSON.
-                    try:
-                        pdf_path = os.path.join("editais", f"{concurso['url_title']}.pdf")
-                        out_json = save_extraction_json(
-                            pdf_path,
-                            source_url_title=concurso.get("url_title"),
-                            source_pdf_filename=f"{concurso['url_title']}.pdf",
-                            pdf_persisted=True,
-                        )
-                        print(f"Extracao salva em {out_json}")
-                    except Exception as ex:
-                        print(f"Aviso: extracao falhou: {ex}")
+                    # Após salvar o PDF, agenda a extração para JSON.
+                    pdf_path = os.path.join("editais", f"{concurso['url_title']}.pdf")
+                    pending.append((concurso, pdf_path, executor.submit(extract_from_pdf, pdf_path, parallel_pages=False)))
             except Exception as e:
                 errors += 1
                 print(f"Erro ao acessar URL: {e}")
@@ -253,12 +280,66 @@ def process_abertura_concursos(abertura_concursos, export_pdf):
             pass
         print(f"{'-'*80}\n")
 
+    if pdf_results is not None:
+        pdf_results.close()
+
+    if executor is not None:
+        with executor:
+            _save_extractions(pending)
+
     return {
         "processed": processed,
         "errors": errors,
         "preview_mode": not export_pdf,
     }
 
+
+def run(days: int, export_pdf: bool = False) -> dict:
+    """
+    Busca concursos dos últimos `days` dias e processa os de abertura.
+
+    Retorna {"returncode": int, "count": int} (count = concursos de abertura).
+    """
+    # Define intervalo: data final hoje e início com base em --days.
+    end_date = datetime.today().strftime('%d-%m-%Y')
+    start_date = (datetime.today() - timedelta(days=days)).strftime('%d-%m-%Y')
+
+    concursos = scrape_concursos(start_date, end_date)
+
+    # Filtra concursos de abertura por palavras-chave.
+    abertura_concursos = []
+    # Usa normalização sem acentos para robustez com diacríticos.
+    keywords = ["abertura", "inicio", "iniciado"]
+
+    for concurso in concursos:
+        title_norm = normalize_text(concurso.get('title', ''))
+        if any(keyword in title_norm for keyword in keywords):
+            abertura_concursos.append(concurso)
+    
+    print(f"\n{'='*80}")
+    print(f"RESULTADO DA COLETA: {start_date} ate {end_date}")
+    print(f"{'='*80}")
+    print(f"Total de concursos encontrados: {len(concursos)}")
+    
+    if concursos:
+        print(f"\nTodos os concursos:")
+        for i, c in enumerate(concursos, 1):
+            title = c.get('title', 'N/A')[:100]  # Truncate long titles
+            print(f"  {i}. {title}")
+    
+    print(f"\n{'='*80}")
+    print(f"Total de concursos de abertura (palavras-chave: {', '.join(keywords)}): {len(abertura_concursos)}")
+    print(f"{'='*80}\n")
+    
+    if abertura_concursos:
+        result = process_abertura_concursos(abertura_concursos, export_pdf)
+        if result["errors"]:
+            print(f"Execucao concluida com {result['errors']} erro(s).")
+    else:
+        print("Nenhum concurso de abertura encontrado no intervalo informado.")
+
+    return {"returncode": 0, "count": len(abertura_concursos)}
+
 if __name__ == "__main__":
 
     args = parse_args()
@@ -370,40 +451,4 @@ if __name__ == "__main__":
         
         exit(0)
 
-    # Define intervalo: data final hoje e início com base em --days.
-    end_date = datetime.today().strftime('%d-%m-%Y')
-    start_date = (datetime.today() - timedelta(days=args.days)).strftime('%d-%m-%Y')
-
-    concursos = scrape_concursos(start_date, end_date)
-
-    # Filtra concursos de abertura por palavras-chave.
-    abertura_concursos = []
-    # Usa normalização sem acentos para robustez com diacríticos.
-    keywords = ["abertura", "inicio", "iniciado"]
-
-    for concurso in concursos:
-        title_norm = normalize_text(concurso.get('title', ''))
-        if any(keyword in title_norm for keyword in keywords):
-            abertura_concursos.append(concurso)
-    
-    print(f"\n{'='*80}")
-    print(f"RESULTADO DA COLETA: {start_date} ate {end_date}")
-    print(f"{'='*80}")
-    print(f"Total de concursos encontrados: {len(concursos)}")
-    
-    if concursos:
-        print(f"\nTodos os concursos:")
-        for i, c in enumerate(concursos, 1):
-            title = c.get('title', 'N/A')[:100]  # Truncate long titles
-            print(f"  {i}. {title}")
-    
-    print(f"\n{'='*80}")
-    print(f"Total de concursos de abertura (palavras-chave: {', '.join(keywords)}): {len(abertura_concursos)}")
-    print(f"{'='*80}\n")
-    
-    if abertura_concursos:
-        result = process_abertura_concursos(abertura_concursos, args.export_pdf)
-        if result["errors"]:
-            print(f"Execucao concluida com {result['errors']} erro(s).")
-    else:
-        print("Nenhum concurso de abertura encontrado no intervalo informado.")
\ No newline at end of file
+    exit(run(args.days, args.export_pdf)["returncode"])
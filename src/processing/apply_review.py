@@ -1,18 +1,25 @@
 """Apply corrections from a review CSV back into JSON summary files.
 
 Usage:
-  .venv/bin/python src/apply_review.py --csv data/review_YYYYMMDDTHHMMSSZ.csv [--summaries-dir data/summaries] [--backup-dir data/backups] [--reviewer NAME] [--apply]
+  .venv/bin/python -m src.processing.apply_review --csv data/review_YYYYMMDDTHHMMSSZ.csv [--summaries-dir data/summaries] [--backup-dir data/backups] [--reviewer NAME] [--apply]
 
 If --apply is not passed the script performs a dry-run and prints planned changes.
 """
 from pathlib import Path
 import argparse
 import csv
-import json
+import os
+from collections import defaultdict
 from datetime import datetime
 import shutil
 from typing import Any
 
+try:
+    from src.utils.json_io import dump_json, load_json
+except ModuleNotFoundError:
+    # Support running with `src` itself on sys.path (tests, `python src/main.py`).
+    from utils.json_io import dump_json, load_json
+
 
 FIELD_MAP = {
     "orgao": ("metadata", "orgao"),
@@ -28,73 +35,165 @@ FIELD_MAP = {
 }
 
 
-def parse_value(target_field: str, raw: str) -> Any:
-    if raw is None:
-        return None
+def _parse_text(raw: str) -> Any:
+    raw = raw.strip()
+    return raw or None
+
+
+def _parse_int(raw: str) -> Any:
     raw = raw.strip()
     if raw == "":
         return None
-    if target_field in ("total", "pcd", "ppiq"):
-        # try int
+    try:
+        return int(raw)
+    except Exception:
+        # sometimes numbers come as floats or with commas
         try:
-            return int(raw)
+            return int(float(raw.replace(".", "").replace(",", ".")))
         except Exception:
-            # sometimes numbers come as floats or with commas
-            try:
-                return int(float(raw.replace(".", "").replace(",", ".")))
-            except Exception:
-                return None
-    # otherwise return raw string
-    return raw
+            return None
 
 
-def apply_row(row: dict, summaries_dir: Path, backup_dir: Path, apply_changes: bool, reviewer: str):
-    filename = row.get("file")
-    if not filename:
-        print("Skipping row with no file field")
-        return
+# target key -> parser; anything not listed is kept as a stripped string
+_PARSERS = {
+    "total": _parse_int,
+    "pcd": _parse_int,
+    "ppiq": _parse_int,
+}
+
+# FIELD_MAP resolved once: (csv_field, section, key, parser), banca excluded
+_FIELD_SPECS = tuple(
+    (csv_field, section, key, _PARSERS.get(key, _parse_text))
+    for csv_field, (section, key) in FIELD_MAP.items()
+    if csv_field != "banca"
+)
+_BANCA_SECTION, _BANCA_KEY = FIELD_MAP["banca"]
+
+
+def parse_value(target_field: str, raw: str) -> Any:
+    if raw is None:
+        return None
+    return _PARSERS.get(target_field, _parse_text)(raw)
+
+
+def _snapshot(src: Path, dst: Path) -> None:
+    """Back up src as dst, hardlinking when the filesystem allows it."""
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copy2(src, dst)
+
+
+def _replace_json(data: Any, path: Path) -> None:
+    """Write JSON to a sibling temp file and swap it in.
+
+    Writing in place would truncate the inode shared with a hardlinked backup.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    dump_json(data, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _banca_change(raw: str, data: dict) -> tuple | None:
+    """CSV 'banca' sets metadata.banca.nome, keeping the rest of the banca dict."""
+    section, key = _BANCA_SECTION, _BANCA_KEY
+    current = data.get(section, {}).get(key)
+    new_val = _parse_text(raw)
+    if new_val is None:
+        return None
+    # ensure dict
+    if section not in data or not isinstance(data.get(section), dict):
+        data[section] = {}
+    banca_obj = data[section].get(key) or {}
+    if not isinstance(banca_obj, dict):
+        banca_obj = {"nome": str(banca_obj)}
+    # set nome and preserve tipo if present
+    banca_obj["nome"] = new_val
+    # mark that this was manually set
+    banca_obj.setdefault("tipo", banca_obj.get("tipo") or "manual")
+    banca_obj["confianca_extracao"] = 1.0
+    if banca_obj != current:
+        return current, banca_obj
+    return None
 
-    summary_path = summaries_dir / filename
-    if not summary_path.exists():
-        print(f"Summary not found: {summary_path}")
-        return
 
-    with summary_path.open(encoding="utf-8") as f:
-        data = json.load(f)
+# CSV columns read per row: the _FIELD_SPECS fields followed by banca
+_ROW_COLUMNS = tuple(spec[0] for spec in _FIELD_SPECS) + ("banca",)
 
+
+def _row_values(row: dict) -> tuple:
+    """Pick the _ROW_COLUMNS cells out of a DictReader-style row."""
+    return tuple(row.get(col) for col in _ROW_COLUMNS)
+
+
+def _row_changes(values: tuple, data: dict) -> dict:
+    """Return {"section.key": (current, new)} for the non-empty cells of a row.
+
+    `values` holds the row cells in _ROW_COLUMNS order.
+    """
     changes = {}
 
-    for csv_field, mapping in FIELD_MAP.items():
-        csv_val = row.get(csv_field, "")
-        if csv_val is None or csv_val.strip() == "":
+    for (csv_field, section, key, parse), csv_val in zip(_FIELD_SPECS, values):
+        if not csv_val:
             continue
-        section, key = mapping
-        current = data.get(section, {}).get(key)
-        new_val = parse_value(key, csv_val)
-        # special-case banca: set metadata.banca.nome
-        if csv_field == "banca":
-            # ensure dict
-            if section not in data or not isinstance(data.get(section), dict):
-                data[section] = {}
-            banca_obj = data[section].get(key) or {}
-            if not isinstance(banca_obj, dict):
-                banca_obj = {"nome": str(banca_obj)}
-            # set nome and preserve tipo if present
-            if isinstance(new_val, str):
-                banca_obj["nome"] = new_val
-            else:
-                banca_obj["nome"] = str(new_val)
-            # mark that this was manually set
-            banca_obj.setdefault("tipo", banca_obj.get("tipo") or "manual")
-            banca_obj["confianca_extracao"] = 1.0
-            new_val = banca_obj
+        new_val = parse(csv_val)
         if new_val is None:
             continue
+        current = data.get(section, {}).get(key)
         if isinstance(new_val, str) and isinstance(current, str) and new_val.strip() == current.strip():
             continue
         if new_val != current:
             changes[f"{section}.{key}"] = (current, new_val)
 
+    banca_val = values[-1]
+    if banca_val:
+        banca_change = _banca_change(banca_val, data)
+        if banca_change:
+            changes[f"{_BANCA_SECTION}.{_BANCA_KEY}"] = banca_change
+
+    return changes
+
+
+def apply_row(row: dict, summaries_dir: Path, backup_dir: Path, apply_changes: bool, reviewer: str):
+    filename = row.get("file")
+    if not filename:
+        print("Skipping row with no file field")
+        return
+
+    apply_rows(filename, [_row_values(row)], summaries_dir, backup_dir, apply_changes, reviewer)
+
+
+def apply_rows(filename: str, rows: list, summaries_dir: Path, backup_dir: Path, apply_changes: bool, reviewer: str):
+    """Apply every CSV row targeting one summary file with a single load/backup/write.
+
+    `rows` holds cell tuples in _ROW_COLUMNS order (see _row_values).
+    """
+    # Rows with only blank cells cannot change anything: skip the JSON round-trip.
+    if not any(val and val.strip() for row in rows for val in row):
+        print(f"No changes for {filename}")
+        return
+
+    summary_path = summaries_dir / filename
+    try:
+        data = load_json(summary_path)
+    except FileNotFoundError:
+        print(f"Summary not found: {summary_path}")
+        return
+
+    # Rows are applied in CSV order, so a later row sees the values set by an
+    # earlier one; a field touched twice keeps its original value as "old".
+    changes = {}
+    for row in rows:
+        for k, (old, new) in _row_changes(row, data).items():
+            section, key = k.split(".")
+            if section not in data:
+                data[section] = {}
+            data[section][key] = new
+            if k in changes:
+                old = changes[k][0]
+            changes[k] = (old, new)
+    changes = {k: (old, new) for k, (old, new) in changes.items() if old != new}
+
     if not changes:
         print(f"No changes for {filename}")
         return
@@ -110,14 +209,7 @@ def apply_row(row: dict, summaries_dir: Path, backup_dir: Path, apply_changes: b
     backup_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
     backup_path = backup_dir / f"{filename}.{timestamp}.bak"
-    shutil.copy2(summary_path, backup_path)
-
-    # apply changes
-    for k, (_, new) in changes.items():
-        section, key = k.split(".")
-        if section not in data:
-            data[section] = {}
-        data[section][key] = new
+    _snapshot(summary_path, backup_path)
 
     # add review metadata
     review_meta = data.get("_review", {})
@@ -125,9 +217,8 @@ def apply_row(row: dict, summaries_dir: Path, backup_dir: Path, apply_changes: b
     review_meta["reviewer"] = reviewer
     data["_review"] = review_meta
 
-    # write back
-    with summary_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # write back (replace, never rewrite in place: the backup may share the inode)
+    _replace_json(data, summary_path)
 
     print(f"Applied changes and backed up to {backup_path}")
 
@@ -136,8 +227,7 @@ def apply_row(row: dict, summaries_dir: Path, backup_dir: Path, apply_changes: b
         examples_dir = Path("data/reviewed_examples")
         examples_dir.mkdir(parents=True, exist_ok=True)
         base = Path(filename).stem
-        ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-        ex_path = examples_dir / f"{base}.{ts}.json"
+        ex_path = examples_dir / f"{base}.{timestamp}.json"
 
         # attempt to derive pdf path
         pdf_path = Path("editais") / f"{base}.pdf"
@@ -170,8 +260,7 @@ def apply_row(row: dict, summaries_dir: Path, backup_dir: Path, apply_changes: b
                 "snippet": snippet,
             })
 
-        with ex_path.open("w", encoding="utf-8") as ef:
-            json.dump(reviewed, ef, ensure_ascii=False, indent=2)
+        dump_json(reviewed, ex_path)
 
         print(f"Exported reviewed example to {ex_path}")
     except Exception as e:
@@ -195,10 +284,29 @@ def main():
         print(f"CSV not found: {csv_path}")
         return
 
-    with csv_path.open(encoding="utf-8") as f:
-        rdr = csv.DictReader(f)
+    # Group rows by target summary so each file is loaded and written once.
+    # Rows are read positionally; only the columns we apply are picked out.
+    rows_by_file = defaultdict(list)
+    with csv_path.open(encoding="utf-8", newline="") as f:
+        rdr = csv.reader(f)
+        header = next(rdr, [])
+        col_idx = {name: i for i, name in enumerate(header)}
+        file_i = col_idx.get("file")
+        value_idx = [col_idx.get(col) for col in _ROW_COLUMNS]
         for row in rdr:
-            apply_row(row, summaries_dir, backup_dir, args.apply, args.reviewer)
+            if not row:
+                continue
+            n = len(row)
+            filename = row[file_i] if file_i is not None and file_i < n else None
+            if not filename:
+                print("Skipping row with no file field")
+                continue
+            rows_by_file[filename].append(
+                tuple(row[i] if i is not None and i < n else None for i in value_idx)
+            )
+
+    for filename, rows in rows_by_file.items():
+        apply_rows(filename, rows, summaries_dir, backup_dir, args.apply, args.reviewer)
 
 
 if __name__ == "__main__":
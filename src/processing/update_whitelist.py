@@ -1,8 +1,14 @@
 import argparse
-import json
+import sys
 from pathlib import Path
 from collections import Counter
 
+try:
+    from src.utils.json_io import dump_json, json_entries, load_json
+except ModuleNotFoundError:
+    # Support running with `src` itself on sys.path (tests, `python src/main.py`).
+    from utils.json_io import dump_json, json_entries, load_json
+
 REVIEWED_DIR = Path("data/reviewed_examples")
 
 # Map field names to their whitelist files
@@ -46,6 +52,33 @@ def _is_valid_value(value: str) -> bool:
     return True
 
 
+def _names_in(path, field: str) -> list:
+    """Upper-cased valid values recorded for `field` in one reviewed example."""
+    try:
+        j = load_json(path)
+    except Exception:
+        return []
+    names = []
+    for change in j.get("changes", []):
+        if change.get("field") != field:
+            continue
+        new = change.get("new")
+        # Handle banca (may be dict with 'nome' or a string); other fields use the value as-is
+        if field == "metadata.banca" and isinstance(new, dict):
+            name = new.get("nome")
+        else:
+            name = new
+
+        # Only count valid values (filter out N/A, null, dashes, etc.)
+        if not name:
+            continue
+        name = str(name)
+        if _is_valid_value(name):
+            # Interned so a name repeated across files is hashed once.
+            names.append(sys.intern(name.upper()))
+    return names
+
+
 def find_candidates(field: str, threshold: int = 3):
     """Find candidates for a given field from reviewed examples.
     
@@ -53,30 +86,8 @@ def find_candidates(field: str, threshold: int = 3):
     real data is added to whitelists.
     """
     c = Counter()
-    files = sorted(REVIEWED_DIR.glob("*.json"))
-    for p in files:
-        try:
-            with p.open(encoding="utf-8") as f:
-                j = json.load(f)
-        except Exception:
-            continue
-        for change in j.get("changes", []):
-            change_field = change.get("field")
-            if change_field == field:
-                new = change.get("new")
-                # Handle banca (may be dict with 'nome' or a string)
-                if field == "metadata.banca":
-                    if isinstance(new, dict):
-                        name = new.get("nome")
-                    else:
-                        name = new
-                else:
-                    # For other fields, just use the value as-is
-                    name = new
-                
-                # Only count valid values (filter out N/A, null, dashes, etc.)
-                if name and _is_valid_value(str(name)):
-                    c[str(name).upper()] += 1
+    for entry in json_entries(REVIEWED_DIR):
+        c.update(_names_in(entry.path, field))
     return c
 
 
@@ -100,26 +111,25 @@ def update_whitelist(field: str, counts: Counter, apply_changes: bool, threshold
         # load existing whitelist
         if whitelist_path.exists():
             try:
-                with whitelist_path.open(encoding="utf-8") as f:
-                    wl = json.load(f)
+                wl = load_json(whitelist_path)
             except Exception:
                 wl = []
         else:
             wl = []
         
-        wl_upper = {str(x).upper(): x for x in wl}
+        wl_upper = {str(x).upper() for x in wl}
         changed = False
         for name, cnt in suggestions:
             if name not in wl_upper:
                 # append the canonical form (title-case)
                 wl.append(name.title())
+                wl_upper.add(name)
                 changed = True
                 print(f"  Added {name.title()} to {field} whitelist")
         
         if changed:
             whitelist_path.parent.mkdir(parents=True, exist_ok=True)
-            with whitelist_path.open("w", encoding="utf-8") as f:
-                json.dump(wl, f, ensure_ascii=False, indent=2)
+            dump_json(wl, whitelist_path)
             print(f"Whitelist updated at {whitelist_path}")
         else:
             print(f"No new items added to {field} whitelist — unchanged.")
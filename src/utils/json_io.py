@@ -0,0 +1,46 @@
+"""Leitura e escrita de JSON, com orjson quando instalado."""
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(raw: str | bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json(path: str | os.PathLike) -> Any:
+    path = Path(path)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: str | os.PathLike, indent: bool = True) -> None:
+    """Write data as UTF-8 JSON; indent=False writes it compact (caches)."""
+    path = Path(path)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        path.write_bytes(orjson.dumps(data, option=option))
+        return
+    path.write_bytes(json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode("utf-8"))
+
+
+def json_entries(directory: Path) -> list:
+    """DirEntry objects of the *.json files in directory, sorted by name."""
+    try:
+        with os.scandir(directory) as it:
+            entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e.name)
+    return entries
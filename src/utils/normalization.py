@@ -1,8 +1,13 @@
 import unicodedata
+from functools import lru_cache
 
 
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """Remove acentos e converte o texto para minúsculas."""
+    # ASCII não tem acentos nem caracteres compostos: basta o lower().
+    if text.isascii():
+        return text.lower()
     return "".join(
         c for c in unicodedata.normalize("NFKD", text)
         if not unicodedata.combining(c)
@@ -0,0 +1,139 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from processing.apply_review import _ROW_COLUMNS, apply_rows, main  # noqa: E402
+
+
+def _row(**cells):
+    return tuple(cells.get(col) for col in _ROW_COLUMNS)
+
+
+class ApplyReviewTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        # reviewed examples are exported relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        self.addCleanup(os.chdir, cwd)
+        self.summaries_dir = self.root / "summaries"
+        self.summaries_dir.mkdir()
+        self.backup_dir = self.root / "backups"
+        self.summary_path = self.summaries_dir / "dou-1.json"
+        self.original = {
+            "metadata": {"orgao": "UFX", "cargo": "Professor"},
+            "vagas": {"total": 1},
+        }
+        self.summary_path.write_text(json.dumps(self.original), encoding="utf-8")
+        self.original_bytes = self.summary_path.read_bytes()
+
+    def apply(self, rows, filename="dou-1.json"):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            apply_rows(filename, rows, self.summaries_dir, self.backup_dir, True, "tester")
+        return out.getvalue()
+
+    def load_summary(self):
+        return json.loads(self.summary_path.read_text(encoding="utf-8"))
+
+
+class TestApplyRows(ApplyReviewTestCase):
+    def test_several_rows_hit_one_file(self):
+        self.apply([_row(orgao="Universidade Federal X"), _row(vagas_total="10")])
+
+        data = self.load_summary()
+        self.assertEqual(data["metadata"]["orgao"], "Universidade Federal X")
+        self.assertEqual(data["vagas"]["total"], 10)
+        self.assertEqual(data["_review"]["reviewer"], "tester")
+        self.assertEqual(len(list(self.backup_dir.iterdir())), 1)
+
+    def test_later_row_keeps_first_old_value(self):
+        output = self.apply([_row(orgao="UFY"), _row(orgao="UFZ")])
+
+        self.assertEqual(self.load_summary()["metadata"]["orgao"], "UFZ")
+        self.assertIn("metadata.orgao: 'UFX' -> 'UFZ'", output)
+
+    def test_later_row_reverting_earlier_one_is_no_change(self):
+        output = self.apply([_row(orgao="UFY"), _row(orgao="UFX")])
+
+        self.assertIn("No changes for dou-1.json", output)
+        self.assertEqual(self.summary_path.read_bytes(), self.original_bytes)
+        self.assertFalse(self.backup_dir.exists())
+
+    def test_backup_keeps_pre_change_bytes(self):
+        self.apply([_row(cargo="Analista")])
+
+        backups = list(self.backup_dir.iterdir())
+        self.assertEqual(len(backups), 1)
+        self.assertEqual(backups[0].read_bytes(), self.original_bytes)
+        self.assertEqual(self.load_summary()["metadata"]["cargo"], "Analista")
+
+    def test_missing_summary(self):
+        output = self.apply([_row(orgao="UFY")], filename="missing.json")
+
+        self.assertIn("Summary not found", output)
+        self.assertFalse(self.backup_dir.exists())
+
+    def test_blank_rows_are_skipped(self):
+        output = self.apply([_row(orgao="  "), _row()])
+
+        self.assertIn("No changes for dou-1.json", output)
+        self.assertEqual(self.summary_path.read_bytes(), self.original_bytes)
+
+
+class TestMain(ApplyReviewTestCase):
+    def run_main(self, csv_text):
+        csv_path = self.root / "review.csv"
+        csv_path.write_text(csv_text, encoding="utf-8")
+        argv = [
+            "apply_review.py",
+            "--csv", str(csv_path),
+            "--summaries-dir", str(self.summaries_dir),
+            "--backup-dir", str(self.backup_dir),
+            "--apply",
+        ]
+        out = io.StringIO()
+        with patch.object(sys, "argv", argv), contextlib.redirect_stdout(out):
+            main()
+        return out.getvalue()
+
+    def test_short_rows(self):
+        output = self.run_main(
+            "file,orgao,cargo,vagas_total\n"
+            "dou-1.json,UFY\n"
+            "dou-1.json\n"
+            "\n"
+            ",UFZ,Analista\n"
+        )
+
+        data = self.load_summary()
+        self.assertEqual(data["metadata"]["orgao"], "UFY")
+        self.assertEqual(data["metadata"]["cargo"], "Professor")
+        self.assertEqual(data["vagas"]["total"], 1)
+        self.assertIn("Skipping row with no file field", output)
+
+    def test_rows_grouped_by_file(self):
+        self.run_main(
+            "file,orgao,vagas_total\n"
+            "dou-1.json,UFY,\n"
+            "dou-1.json,,5\n"
+        )
+
+        data = self.load_summary()
+        self.assertEqual(data["metadata"]["orgao"], "UFY")
+        self.assertEqual(data["vagas"]["total"], 5)
+        self.assertEqual(len(list(self.backup_dir.iterdir())), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
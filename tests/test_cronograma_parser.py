@@ -11,6 +11,7 @@ from extraction.cronograma_parser import (
     classify_event,
     normalize_text,
     extract_all_dates,
+    extract_many,
     CronogramaParser
 )
 
@@ -397,6 +398,22 @@ class TestEdgeCases(unittest.TestCase):
         self.assertGreaterEqual(len(results), 1)
 
 
+class TestExtractMany(unittest.TestCase):
+    """Test the batch entry point"""
+
+    def test_matches_single_extraction_in_order(self):
+        """Pool results equal per-text extraction, in input order"""
+        texts = [
+            "Período de inscrições: 10/02/2026 a 20/02/2026\nProva objetiva: 15/03/2026",
+            "Sem datas aqui",
+            "Isenção da taxa: 05/02/2026",
+        ]
+        expected = [CronogramaParser().extract_from_text(t) for t in texts]
+        self.assertEqual(extract_many(texts, workers=2), expected)
+        self.assertEqual(extract_many(texts, workers=1), expected)
+        self.assertEqual(CronogramaParser.extract_many(texts, workers=2), expected)
+
+
 
 if __name__ == '__main__':
     unittest.main()
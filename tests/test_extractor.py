@@ -1,7 +1,9 @@
 import unittest
 import sys
 import json
+import os
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,11 +12,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from extraction.extractor import (
     _find_first_currency,
+    _load_whitelist,
     _parse_date,
+    _parse_dmy_groups,
     extract_basic_metadata,
     extract_cronograma,
     extract_vagas,
     extract_financeiro,
+    extract_from_pdf,
     save_extraction_json,
 )
 
@@ -100,6 +105,11 @@ class TestParseDate(unittest.TestCase):
         if result:
             self.assertRegex(result, r'^\d{4}-\d{2}-\d{2}$')
 
+    def test_full_month_name_without_dateparser(self):
+        """Full month names are parsed directly"""
+        self.assertEqual(_parse_date("10 de fevereiro de 2026"), "2026-02-10")
+        self.assertEqual(_parse_date("5 de Março de 2026"), "2026-03-05")
+
     def test_portuguese_date_format_2(self):
         """Test abbreviated Portuguese date"""
         result = _parse_date("20 de fev de 2026")
@@ -126,6 +136,16 @@ class TestParseDate(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestParseDmyGroups(unittest.TestCase):
+    """Test the _parse_dmy_groups() function (no dateparser needed)"""
+
+    def test_valid_date(self):
+        self.assertEqual(_parse_dmy_groups("5", "3", "2026"), "2026-03-05")
+
+    def test_invalid_date(self):
+        self.assertIsNone(_parse_dmy_groups("31", "02", "2026"))
+
+
 class TestExtractBasicMetadata(unittest.TestCase):
     """Test the extract_basic_metadata() function"""
 
@@ -264,6 +284,23 @@ class TestExtractVagas(unittest.TestCase):
         self.assertEqual(result["total"], 1000)
 
 
+class TestLoadWhitelist(unittest.TestCase):
+    def test_missing_file_returns_empty(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(_load_whitelist(Path(tmp) / "missing.json"), [])
+
+    def test_edited_file_is_read_again(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bancas.json"
+            path.write_text(json.dumps(["fcc"]), encoding="utf-8")
+            self.assertEqual(_load_whitelist(path), ["FCC"])
+
+            path.write_text(json.dumps(["fcc", "vunesp"]), encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(_load_whitelist(path), ["FCC", "VUNESP"])
+
+
 class TestSaveExtractionJson(unittest.TestCase):
     def test_save_uses_canonical_name_and_removes_legacy_same_id(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -306,6 +343,72 @@ class TestSaveExtractionJson(unittest.TestCase):
             self.assertEqual(saved.get("_source", {}).get("pdf_filename"), "edital-de-abertura-690330310.pdf")
 
 
+class TestExtractionCache(unittest.TestCase):
+    TEXT = "EDITAL DE ABERTURA Nº 1/2026\nBanca: FCC\nTaxa de inscrição: R$ 100,00"
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.pdf_path = self.root / "edital.pdf"
+        self.pdf_path.write_bytes(b"%PDF-1.4 dummy")
+        self.bancas_path = self.root / "bancas.json"
+        self.bancas_path.write_text(json.dumps(["fcc"]), encoding="utf-8")
+        for name, value in (
+            ("EXTRACTION_CACHE_DIR", self.root / ".cache"),
+            ("BANCAS_WHITELIST_PATH", self.bancas_path),
+            ("CARGOS_WHITELIST_PATH", self.root / "cargos.json"),
+        ):
+            patcher = patch(f"extraction.extractor.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch("extraction.extractor._extract_text_from_pdf", return_value=self.TEXT)
+        self.extract_text = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_pdf_is_served_from_cache(self):
+        first = extract_from_pdf(str(self.pdf_path))
+        second = extract_from_pdf(str(self.pdf_path))
+        self.assertEqual(first, second)
+        self.assertEqual(self.extract_text.call_count, 1)
+
+    def test_changed_pdf_misses(self):
+        extract_from_pdf(str(self.pdf_path))
+        self.pdf_path.write_bytes(b"%PDF-1.4 other")
+        extract_from_pdf(str(self.pdf_path))
+        self.assertEqual(self.extract_text.call_count, 2)
+
+    def test_whitelist_edit_invalidates(self):
+        extract_from_pdf(str(self.pdf_path))
+        self.bancas_path.write_text(json.dumps(["fcc", "vunesp"]), encoding="utf-8")
+        stat = self.bancas_path.stat()
+        os.utime(self.bancas_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        extract_from_pdf(str(self.pdf_path))
+        self.assertEqual(self.extract_text.call_count, 2)
+
+    def test_resolved_engine_is_part_of_key(self):
+        with patch("extraction.extractor.PDF_TEXT_ENGINE", "pymupdf"), \
+                patch("extraction.extractor._get_fitz", return_value=None):
+            extract_from_pdf(str(self.pdf_path))
+        # pymupdf was requested but unavailable: the pdfplumber entry is reused
+        extract_from_pdf(str(self.pdf_path))
+        self.assertEqual(self.extract_text.call_count, 1)
+
+    def test_missing_dependency_result_is_not_reused(self):
+        with patch("extraction.extractor._get_dateparser", return_value=None):
+            extract_from_pdf(str(self.pdf_path))
+        with patch("extraction.extractor._get_dateparser", return_value=object()):
+            extract_from_pdf(str(self.pdf_path))
+        self.assertEqual(self.extract_text.call_count, 2)
+
+    def test_oldest_entries_are_pruned(self):
+        with patch("extraction.extractor.EXTRACTION_CACHE_MAX_ENTRIES", 1):
+            extract_from_pdf(str(self.pdf_path))
+            self.pdf_path.write_bytes(b"%PDF-1.4 other")
+            extract_from_pdf(str(self.pdf_path))
+        self.assertEqual(len(list((self.root / ".cache").glob("*.json"))), 1)
+
+
 class TestExtractFinanceiro(unittest.TestCase):
     """Test the extract_financeiro() function"""
 
@@ -403,6 +506,37 @@ class TestExtractCronograma(unittest.TestCase):
         self.assertTrue(fields_filled >= 1)
 
 
+class TestRegexBacktracking(unittest.TestCase):
+    """Long whitespace runs must not make the extractors quadratic"""
+
+    N = 5000
+
+    def _best_time(self, func, text, repeat=3):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(text)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def assertLinear(self, func, make_text):
+        """4x the input may cost roughly 4x the time; quadratic would be 16x."""
+        small = self._best_time(func, make_text(" " * self.N))
+        large = self._best_time(func, make_text(" " * (4 * self.N)))
+        # The floor keeps timer noise on tiny timings from deciding the test
+        self.assertLess(large, 8 * max(small, 1e-3))
+
+    def test_edital_type_with_long_space_run(self):
+        self.assertLinear(extract_basic_metadata, lambda spaces: "EDITAL A" + spaces + "B")
+
+    def test_cronograma_label_with_long_space_run(self):
+        for label in ("Período de Inscrição", "Solicitação de isenção", "Data provável das provas"):
+            self.assertLinear(extract_cronograma, lambda spaces: label + spaces + "x 01/02/2026")
+
+    def test_cargo_label_with_long_space_run(self):
+        self.assertLinear(extract_basic_metadata, lambda spaces: "cargo" + spaces + "!")
+
+
 class TestExtractorEdgeCases(unittest.TestCase):
     """Test edge cases and malformed inputs across extractor module"""
 